@@ -0,0 +1,165 @@
+"""
+Shared helpers
+
+Small, pure helper functions shared by the model and both JSON generators.
+"""
+
+import datetime
+import json
+import math
+from decimal import Decimal
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .model import Characteristic, Property
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def local_name(urn: str) -> str:
+    """Extract the local name from a URN."""
+    if '#' in urn:
+        return urn.split('#')[-1]
+    elif '/' in urn:
+        return urn.split('/')[-1]
+    else:
+        return urn
+
+
+@lru_cache(maxsize=512)
+def xsd_local_name(xsd_type: str) -> str:
+    """Extract the local type name from an XSD type URI or prefixed name."""
+    return xsd_type.split('#')[-1] if '#' in xsd_type else xsd_type.split(':')[-1]
+
+
+class CharKind(IntEnum):
+    """How a characteristic is rendered by the JSON generators."""
+    SCALAR = 0
+    BOOLEAN = 1
+    COLLECTION = 2
+    EITHER = 3
+    ENUMERATION = 4
+    ENTITY = 5
+    MULTILANG = 6
+
+
+_COLLECTION_TYPES = frozenset(("Collection", "List", "Set", "SortedSet", "TimeSeries"))
+_ENUMERATION_TYPES = frozenset(("Enumeration", "State"))
+
+
+def characteristic_kind(char: 'Characteristic', entity_urns: AbstractSet[str]) -> CharKind:
+    """Classify a characteristic by its type and data type."""
+    char_type = char.characteristic_type
+    if char_type == "Boolean":
+        return CharKind.BOOLEAN
+    elif char_type in _COLLECTION_TYPES:
+        return CharKind.COLLECTION
+    elif char_type == "Either":
+        return CharKind.EITHER
+    elif char_type in _ENUMERATION_TYPES:
+        return CharKind.ENUMERATION
+    elif char_type == "SingleEntity" or (char.data_type and char.data_type in entity_urns):
+        return CharKind.ENTITY
+    elif char_type == "MultiLanguageText" or char.data_type == "rdf:langString":
+        return CharKind.MULTILANG
+    else:
+        return CharKind.SCALAR
+
+
+def payload_plan(properties: List['Property']) -> List[Tuple['Property', str, bool]]:
+    """Compute the (property, payload name, optional) entries that appear in the JSON payload."""
+    return [
+        (prop, prop.payload_name or prop.local_name, prop.optional)
+        for prop in properties
+        if not prop.not_in_payload
+    ]
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Same ISO 8601 form orjson produces natively
+        return value.isoformat()
+    return str(value)
+
+
+def _orjson_dumps(obj: Any, indent: int) -> Optional[bytes]:
+    """Serialize with orjson, or return None when the stdlib encoder must be used."""
+    if orjson is None or indent != 2:
+        return None
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+    except TypeError:
+        # e.g. integers beyond 64 bit; let the stdlib encoder handle them
+        return None
+
+
+def copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like structure; other values are immutable and shared."""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_json(item) for key, item in value.items()}
+    elif value_type is list:
+        return [copy_json(item) for item in value]
+    return value
+
+
+def dumps_json(obj: Any, indent: int = 2) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    data = _orjson_dumps(obj, indent)
+    if data is not None:
+        return data.decode('utf-8')
+    return json.dumps(obj, indent=indent, ensure_ascii=False, default=_json_default)
+
+
+def dump_json_file(obj: Any, file_path: str, indent: int = 2):
+    """Serialize straight to a UTF-8 file without building an intermediate str."""
+    data = _orjson_dumps(obj, indent)
+    if data is not None:
+        with open(file_path, 'wb') as fh:
+            fh.write(data)
+    else:
+        with open(file_path, 'w', encoding='utf-8') as fh:
+            json.dump(obj, fh, indent=indent, ensure_ascii=False, default=_json_default)
+
+
+def _literal_source(value: Any, constants: Dict[str, Any]) -> str:
+    """Render a value as a Python expression; values without a literal form become named constants."""
+    value_type = type(value)
+    if value_type is dict:
+        items = ', '.join(
+            f"{_literal_source(k, constants)}: {_literal_source(v, constants)}" for k, v in value.items()
+        )
+        return '{' + items + '}'
+    elif value_type is list:
+        return '[' + ', '.join(_literal_source(v, constants) for v in value) + ']'
+    elif value_type is tuple:
+        return '(' + ''.join(f"{_literal_source(v, constants)}, " for v in value) + ')'
+    elif value is None or value_type in (bool, int, str):
+        return repr(value)
+    elif value_type is float and math.isfinite(value):
+        return repr(value)
+
+    name = f"_c{len(constants)}"
+    constants[name] = value
+    return name
+
+
+def compile_literal_factory(value: Any, filename: str) -> Callable[[], Any]:
+    """Compile a function that rebuilds a JSON-like structure from straight-line literals.
+
+    Each call returns a fresh, independent structure equal to value.
+    """
+    constants = {}
+    source = f"def _generated():\n    return {_literal_source(value, constants)}\n"
+    namespace = dict(constants)
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace['_generated']
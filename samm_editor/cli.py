@@ -5,14 +5,19 @@ Command-line interface for the SAMM Model Editor.
 """
 
 import click
-import json
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+from . import __version__, _utils, model as _model, parser as _parser
 from .parser import SAMMParser
 from .writer import SAMMWriter
 from .json_schema_generator import JSONSchemaGenerator
 from .json_instance_generator import JSONInstanceGenerator
-from .model import SAMMModel
+from .model import SAMMModel, LocalizedString
 
 
 @click.group()
@@ -22,35 +27,166 @@ def cli():
     pass
 
 
-@cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-def info(input_file):
-    """Display information about a SAMM model file."""
+def _get_en(localized: Optional[LocalizedString]) -> str:
+    """Return the English text of a LocalizedString, or '' if missing."""
+    return localized.values.get('en', '') if localized else ''
+
+
+def _batch_output_path(output: str, input_file: str, suffix: str) -> Path:
+    """Derive the output file for one of several input files inside the output directory."""
+    out_dir = Path(output)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir / f"{Path(input_file).stem}{suffix}"
+
+
+def _output_paths(input_files, output: str, suffix: str):
+    """Map each input file to its output path (a file for one input, a directory for many)."""
+    if len(input_files) == 1:
+        return [output]
+    output_files = [_batch_output_path(output, input_file, suffix) for input_file in input_files]
+    # Input files with the same name (e.g. in different directories) would overwrite each other
+    seen = {}
+    for input_file, output_file in zip(input_files, output_files):
+        other = seen.setdefault(output_file, input_file)
+        if other is not input_file:
+            raise click.UsageError(f"{other} and {input_file} would both be written to {output_file}")
+    return output_files
+
+
+def _cache_dir() -> Path:
+    """Directory holding cached generator output."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'samm-editor'
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint(generator_cls) -> bytes:
+    """Hash of the code that shapes generator_cls output: parser, model, helpers and generator."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module in (_parser, _model, _utils, sys.modules[generator_cls.__module__]):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.digest()
+
+
+def _cache_file(generator_cls, input_file: str) -> Path:
+    """Cache entry for generator_cls output on the current content of input_file."""
+    digest = hashlib.blake2b(digest_size=16)
+    # The version and the code fingerprint are part of the key so entries
+    # written by other releases or code changes are not reused
+    digest.update(f"{__version__}:{generator_cls.__name__}:".encode('utf-8'))
+    digest.update(_code_fingerprint(generator_cls))
+    digest.update(Path(input_file).read_bytes())
+    return _cache_dir() / f"{digest.hexdigest()}.json"
+
+
+def _read_cache(cache_file: Path) -> Optional[bytes]:
+    """Return a cached result, or None if there is none."""
+    try:
+        return cache_file.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cache(cache_file: Path, data: bytes):
+    """Store a result in the cache; failures only mean the next run is not cached."""
     try:
-        parser = SAMMParser()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _lookup_cache(generator_cls, input_file: str, use_cache: bool):
+    """Return the cache entry for this input and its content (None if not cached)."""
+    if not use_cache:
+        return None, None
+    cache_file = _cache_file(generator_cls, input_file)
+    return cache_file, _read_cache(cache_file)
+
+
+def _generate_json_string(generator_cls, input_file: str, use_cache: bool = True) -> str:
+    """Return the JSON produced by generator_cls for a SAMM model file."""
+    cache_file, cached = _lookup_cache(generator_cls, input_file, use_cache)
+    if cached is not None:
+        return cached.decode('utf-8')
+
+    parser = SAMMParser(parse_orphans=False)
+    model = parser.parse_file(input_file)
+    result = generator_cls(model).generate_string()
+
+    if cache_file:
+        _write_cache(cache_file, result.encode('utf-8'))
+    return result
+
+
+def _write_json_output(generator_cls, model: SAMMModel, output_file: str, cache_file: Optional[Path]):
+    """Write the JSON produced by generator_cls to output_file and cache it."""
+    generator_cls(model).write_to_file(str(output_file))
+    if cache_file:
+        _write_cache(cache_file, Path(output_file).read_bytes())
+
+
+def _generate_json_file(generator_cls, input_file: str, output_file: str, use_cache: bool = True) -> str:
+    """Write the JSON produced by generator_cls for a SAMM model file to output_file."""
+    cache_file, cached = _lookup_cache(generator_cls, input_file, use_cache)
+    if cached is not None:
+        Path(output_file).write_bytes(cached)
+    else:
+        parser = SAMMParser(parse_orphans=False)
         model = parser.parse_file(input_file)
+        _write_json_output(generator_cls, model, output_file, cache_file)
+    return str(output_file)
 
-        click.echo(f"SAMM Model: {input_file}")
-        click.echo(f"Namespace: {model.namespace}")
-        click.echo()
 
-        if model.aspect:
-            click.echo(f"Aspect: {model.aspect.urn}")
-            if model.aspect.preferred_name:
-                click.echo(f"  Name: {model.aspect.preferred_name.values.get('en', '')}")
-            if model.aspect.description:
-                click.echo(f"  Description: {model.aspect.description.values.get('en', '')}")
-            click.echo(f"  Properties: {len(model.aspect.properties)}")
-            click.echo(f"  Operations: {len(model.aspect.operations)}")
-            click.echo(f"  Events: {len(model.aspect.events)}")
-            click.echo()
+def _generate_json_files(generator_cls, input_files, output_files, use_cache: bool = True):
+    """Generate JSON files for several models, in parallel worker processes when more than one."""
+    if len(input_files) == 1:
+        return [_generate_json_file(generator_cls, input_files[0], output_files[0], use_cache)]
 
-        click.echo(f"Entities: {len(model.entities)}")
-        for entity_urn, entity in model.entities.items():
-            click.echo(f"  - {entity_urn}")
+    max_workers = min(len(input_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            _generate_json_file, [generator_cls] * len(input_files), input_files, output_files,
+            [use_cache] * len(input_files)
+        ))
 
-        click.echo(f"Characteristics: {len(model.characteristics)}")
-        click.echo(f"Properties: {len(model.properties)}")
+
+@cli.command()
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+def info(input_files):
+    """Display information about one or more SAMM model files."""
+    try:
+        for index, input_file in enumerate(input_files):
+            parser = SAMMParser()
+            model = parser.parse_file(input_file)
+
+            # Collect the report and write it in one go
+            lines = [""] if index else []
+            lines.append(f"SAMM Model: {input_file}")
+            lines.append(f"Namespace: {model.namespace}")
+            lines.append("")
+
+            aspect = model.aspect
+            if aspect:
+                lines.append(f"Aspect: {aspect.urn}")
+                if aspect.preferred_name:
+                    lines.append(f"  Name: {_get_en(aspect.preferred_name)}")
+                if aspect.description:
+                    lines.append(f"  Description: {_get_en(aspect.description)}")
+                lines.append(f"  Properties: {len(aspect.properties)}")
+                lines.append(f"  Operations: {len(aspect.operations)}")
+                lines.append(f"  Events: {len(aspect.events)}")
+                lines.append("")
+
+            lines.append(f"Entities: {len(model.entities)}")
+            lines.extend(f"  - {entity_urn}" for entity_urn in model.entities)
+
+            lines.append(f"Characteristics: {len(model.characteristics)}")
+            lines.append(f"Properties: {len(model.properties)}")
+
+            click.echo("\n".join(lines))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -58,24 +194,23 @@ def info(input_file):
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-@click.option('-o', '--output', type=click.Path(), help='Output file (default: stdout)')
-def generate_schema(input_file, output):
-    """Generate JSON Schema from a SAMM model."""
-    try:
-        parser = SAMMParser()
-        model = parser.parse_file(input_file)
-
-        generator = JSONSchemaGenerator(model)
-        schema = generator.generate()
-
-        schema_json = json.dumps(schema, indent=2)
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('-o', '--output', type=click.Path(),
+              help='Output file (default: stdout); output directory for multiple input files')
+@click.option('--cache/--no-cache', default=False,
+              help='Reuse and store output cached for unchanged input files (default: off)')
+def generate_schema(input_files, output, cache):
+    """Generate JSON Schema from one or more SAMM models."""
+    if len(input_files) > 1 and not output:
+        raise click.UsageError("--output directory is required for multiple input files")
+    output_files = _output_paths(input_files, output, '_schema.json') if output else None
 
+    try:
         if output:
-            Path(output).write_text(schema_json)
-            click.echo(f"JSON Schema written to: {output}")
+            for output_file in _generate_json_files(JSONSchemaGenerator, input_files, output_files, cache):
+                click.echo(f"JSON Schema written to: {output_file}")
         else:
-            click.echo(schema_json)
+            click.echo(_generate_json_string(JSONSchemaGenerator, input_files[0], cache))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -83,24 +218,23 @@ def generate_schema(input_file, output):
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-@click.option('-o', '--output', type=click.Path(), help='Output file (default: stdout)')
-def generate_instance(input_file, output):
-    """Generate example JSON instance from a SAMM model."""
-    try:
-        parser = SAMMParser()
-        model = parser.parse_file(input_file)
-
-        generator = JSONInstanceGenerator(model)
-        instance = generator.generate()
-
-        instance_json = json.dumps(instance, indent=2)
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('-o', '--output', type=click.Path(),
+              help='Output file (default: stdout); output directory for multiple input files')
+@click.option('--cache/--no-cache', default=False,
+              help='Reuse and store output cached for unchanged input files (default: off)')
+def generate_instance(input_files, output, cache):
+    """Generate example JSON instance from one or more SAMM models."""
+    if len(input_files) > 1 and not output:
+        raise click.UsageError("--output directory is required for multiple input files")
+    output_files = _output_paths(input_files, output, '_instance.json') if output else None
 
+    try:
         if output:
-            Path(output).write_text(instance_json)
-            click.echo(f"JSON instance written to: {output}")
+            for output_file in _generate_json_files(JSONInstanceGenerator, input_files, output_files, cache):
+                click.echo(f"JSON instance written to: {output_file}")
         else:
-            click.echo(instance_json)
+            click.echo(_generate_json_string(JSONInstanceGenerator, input_files[0], cache))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -108,18 +242,20 @@ def generate_instance(input_file, output):
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-@click.option('-o', '--output', type=click.Path(), required=True, help='Output Turtle file')
-def convert(input_file, output):
-    """Convert/reformat a SAMM model file."""
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('-o', '--output', type=click.Path(), required=True,
+              help='Output Turtle file; output directory for multiple input files')
+@click.option('--streaming', is_flag=True,
+              help='Write one triple per line (N-Triples) instead of formatted Turtle; faster for large models')
+def convert(input_files, output, streaming):
+    """Convert/reformat one or more SAMM model files."""
+    output_files = [str(f) for f in _output_paths(input_files, output, '.ttl')]
     try:
-        parser = SAMMParser()
-        model = parser.parse_file(input_file)
-
-        writer = SAMMWriter(model)
-        writer.write_to_file(output)
+        models = (SAMMParser().parse_file(input_file) for input_file in input_files)
+        SAMMWriter.write_many(models, output_files, streaming=streaming)
 
-        click.echo(f"Model written to: {output}")
+        for output_file in output_files:
+            click.echo(f"Model written to: {output_file}")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -127,32 +263,52 @@ def convert(input_file, output):
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-@click.option('--schema', type=click.Path(), help='Output JSON Schema file')
-@click.option('--instance', type=click.Path(), help='Output JSON instance file')
-def generate_all(input_file, schema, instance):
-    """Generate both JSON Schema and instance from a SAMM model."""
-    try:
-        parser = SAMMParser()
-        model = parser.parse_file(input_file)
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--schema', type=click.Path(),
+              help='Output JSON Schema file; output directory for multiple input files')
+@click.option('--instance', type=click.Path(),
+              help='Output JSON instance file; output directory for multiple input files')
+@click.option('--cache/--no-cache', default=False,
+              help='Reuse and store output cached for unchanged input files (default: off)')
+def generate_all(input_files, schema, instance, cache):
+    """Generate both JSON Schema and instance from one or more SAMM models."""
+    if not schema and not instance:
+        click.echo("Please specify at least one output file (--schema or --instance)")
+        sys.exit(1)
 
-        # Generate schema
-        if schema:
-            generator = JSONSchemaGenerator(model)
-            schema_json = generator.generate_string()
-            Path(schema).write_text(schema_json)
-            click.echo(f"JSON Schema written to: {schema}")
-
-        # Generate instance
-        if instance:
-            generator = JSONInstanceGenerator(model)
-            instance_json = generator.generate_string()
-            Path(instance).write_text(instance_json)
-            click.echo(f"JSON instance written to: {instance}")
-
-        if not schema and not instance:
-            click.echo("Please specify at least one output file (--schema or --instance)")
-            sys.exit(1)
+    targets = []
+    if schema:
+        targets.append((JSONSchemaGenerator, _output_paths(input_files, schema, '_schema.json'),
+                        "JSON Schema"))
+    if instance:
+        targets.append((JSONInstanceGenerator, _output_paths(input_files, instance, '_instance.json'),
+                        "JSON instance"))
+
+    try:
+        # Schema and instance are independent, so they are written concurrently;
+        # each task creates its own generator and only reads the shared model
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            for index, input_file in enumerate(input_files):
+                lookups = [_lookup_cache(generator_cls, input_file, cache) for generator_cls, _, _ in targets]
+
+                # Parsed only on a cache miss, and then once for both outputs
+                model = None
+                if any(cached is None for _, cached in lookups):
+                    parser = SAMMParser(parse_orphans=False)
+                    model = parser.parse_file(input_file)
+
+                futures = []
+                for (generator_cls, output_files, _), (cache_file, cached) in zip(targets, lookups):
+                    if cached is not None:
+                        futures.append(executor.submit(Path(output_files[index]).write_bytes, cached))
+                    else:
+                        futures.append(executor.submit(
+                            _write_json_output, generator_cls, model, output_files[index], cache_file
+                        ))
+
+                for future, (_, output_files, label) in zip(futures, targets):
+                    future.result()
+                    click.echo(f"{label} written to: {output_files[index]}")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -160,33 +316,40 @@ def generate_all(input_file, schema, instance):
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
-def validate(input_file):
-    """Validate a SAMM model file."""
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+def validate(input_files):
+    """Validate one or more SAMM model files."""
     try:
-        parser = SAMMParser()
-        model = parser.parse_file(input_file)
+        all_valid = True
+
+        for input_file in input_files:
+            parser = SAMMParser()
+            model = parser.parse_file(input_file)
 
-        # Basic validation
-        errors = []
+            # Basic validation
+            errors = []
 
-        if not model.aspect:
-            errors.append("No Aspect found in the model")
+            if not model.aspect:
+                errors.append("No Aspect found in the model")
 
-        if model.aspect:
-            if not model.aspect.preferred_name or 'en' not in model.aspect.preferred_name.values:
-                errors.append("Aspect must have preferredName with 'en' language tag")
+            if model.aspect:
+                if not model.aspect.preferred_name or 'en' not in model.aspect.preferred_name.values:
+                    errors.append("Aspect must have preferredName with 'en' language tag")
 
-            if not model.aspect.description or 'en' not in model.aspect.description.values:
-                errors.append("Aspect must have description with 'en' language tag")
+                if not model.aspect.description or 'en' not in model.aspect.description.values:
+                    errors.append("Aspect must have description with 'en' language tag")
 
-        if errors:
-            click.echo("Validation errors:")
-            for error in errors:
-                click.echo(f"  - {error}")
+            prefix = f"{input_file}: " if len(input_files) > 1 else ""
+            if errors:
+                all_valid = False
+                lines = [f"{prefix}Validation errors:"]
+                lines.extend(f"  - {error}" for error in errors)
+                click.echo("\n".join(lines))
+            else:
+                click.echo(f"{prefix}Model is valid!")
+
+        if not all_valid:
             sys.exit(1)
-        else:
-            click.echo("Model is valid!")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
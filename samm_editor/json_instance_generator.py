@@ -4,49 +4,161 @@ JSON Instance Generator
 Generates example JSON instances from SAMM Aspect Models.
 """
 
-import json
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from .model import (
     SAMMModel, Aspect, Property, Characteristic, Entity
 )
+from ._utils import (
+    CharKind, characteristic_kind, xsd_local_name, payload_plan,
+    dumps_json, dump_json_file, compile_literal_factory
+)
+
+
+# Example values for XSD types that do not depend on the item index
+_TYPE_DEFAULTS_STATIC = MappingProxyType({
+    # Boolean
+    "boolean": True,
+
+    # String types
+    "string": "example string",
+    "anyURI": "https://example.com/resource",
+    "curie": "ex:Resource",
+    "hexBinary": "48656C6C6F",
+    "base64Binary": "SGVsbG8gV29ybGQ=",
+
+    # Date/Time types
+    "date": "2024-01-15",
+    "time": "14:30:00",
+    "dateTime": "2024-01-15T14:30:00Z",
+    "dateTimeStamp": "2024-01-15T14:30:00Z",
+    "gYear": "2024",
+    "gMonth": "--01",
+    "gDay": "---15",
+    "gYearMonth": "2024-01",
+    "gMonthDay": "--01-15",
+    "duration": "P1Y2M3DT4H5M6S",
+    "dayTimeDuration": "P1DT2H",
+    "yearMonthDuration": "P1Y2M",
+})
+
+# (base, step) per numeric XSD type; the example value is base + index * step
+_NUMERIC_DEFAULTS = MappingProxyType({
+    # Integer types
+    "integer": (42, 1),
+    "int": (42, 1),
+    "long": (1000, 1),
+    "short": (10, 1),
+    "byte": (1, 1),
+    "nonNegativeInteger": (0, 1),
+    "positiveInteger": (1, 1),
+    "unsignedLong": (1000, 1),
+    "unsignedInt": (100, 1),
+    "unsignedShort": (10, 1),
+    "unsignedByte": (1, 1),
+
+    # Number types
+    "decimal": (3.14, 1),
+    "float": (1.5, 0.5),
+    "double": (2.718, 0.1),
+})
+
+
+def _convert_dict(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Convert the values of a dict."""
+    return {k: _convert_value(v) for k, v in value.items()}
+
+
+def _convert_sequence(value) -> List[Any]:
+    """Convert the items of a list or tuple."""
+    return [_convert_value(v) for v in value]
+
+
+# Converters keyed by concrete type; any other value is already JSON-compatible
+_CONVERTERS = {
+    Decimal: float,
+    dict: _convert_dict,
+    list: _convert_sequence,
+    tuple: _convert_sequence,
+}
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert Python values to JSON-compatible types."""
+    converter = _CONVERTERS.get(type(value))
+    return value if converter is None else converter(value)
+
+
+def _has_decimal_example(model: SAMMModel) -> bool:
+    """Check whether any Aspect/Entity property has an example value containing a Decimal."""
+    owners = list(model.entities.values())
+    if model.aspect:
+        owners.append(model.aspect)
+
+    stack = [prop.example_value for owner in owners for prop in owner.properties]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is Decimal:
+            return True
+        elif value_type is dict:
+            stack.extend(value.values())
+        elif value_type is list or value_type is tuple:
+            stack.extend(value)
+    return False
 
 
 class JSONInstanceGenerator:
     """Generates example JSON instances from SAMM models."""
 
+    __slots__ = (
+        'model', '_entity_urns', '_payload_plans', '_value_builders', '_kinds', '_needs_conversion',
+    )
+
     def __init__(self, model: SAMMModel):
         self.model = model
+        # Entity URNs, looked up for every characteristic
+        self._entity_urns = frozenset(model.entities)
+        # Payload plans keyed by id() of the owning Aspect/Entity
+        self._payload_plans = {}
+        # Value generators per characteristic kind, and the kind of each characteristic seen
+        self._value_builders = {
+            CharKind.BOOLEAN: self._generate_scalar_value,
+            CharKind.COLLECTION: self._generate_collection_value,
+            CharKind.EITHER: self._generate_either_value,
+            CharKind.ENUMERATION: self._generate_enumeration_value,
+            CharKind.ENTITY: self._generate_entity_value,
+            CharKind.MULTILANG: lambda char: self._generate_multilanguage_value(),
+            CharKind.SCALAR: self._generate_scalar_value,
+        }
+        self._kinds = {}
+        # Example values only need converting if the model contains a Decimal;
+        # set by generate()
+        self._needs_conversion = False
 
     def _convert_value(self, value: Any) -> Any:
         """Convert Python values to JSON-compatible types."""
-        if isinstance(value, Decimal):
-            return float(value)
-        elif isinstance(value, dict):
-            return {k: self._convert_value(v) for k, v in value.items()}
-        elif isinstance(value, (list, tuple)):
-            return [self._convert_value(v) for v in value]
-        else:
+        if not self._needs_conversion:
             return value
+        return _convert_value(value)
 
     def generate(self) -> Dict[str, Any]:
         """Generate an example JSON instance for the Aspect."""
         if not self.model.aspect:
             raise ValueError("No Aspect found in the model")
 
-        instance = {}
-
-        for prop in self.model.aspect.properties:
-            if prop.not_in_payload:
-                continue
+        # Start from empty per-run state; the caches are keyed by id() and
+        # would go stale if the model changed since the last run
+        self._payload_plans.clear()
+        self._kinds.clear()
+        self._entity_urns = frozenset(self.model.entities)
+        self._needs_conversion = _has_decimal_example(self.model)
 
-            # Skip optional properties in some cases (50% chance)
-            if prop.optional:
-                # For simplicity, we'll include optional properties
-                pass
-
-            prop_name = prop.payload_name or self._get_local_name(prop.urn)
+        instance = {}
 
+        # For simplicity, optional properties are always included
+        for prop, prop_name, _ in self._payload_plan(self.model.aspect):
             # Use example value if available
             if prop.example_value is not None:
                 instance[prop_name] = self._convert_value(prop.example_value)
@@ -59,31 +171,10 @@ class JSONInstanceGenerator:
 
     def _generate_characteristic_value(self, char: Characteristic) -> Any:
         """Generate an example value for a characteristic."""
-        char_type = char.characteristic_type
-
-        # Handle collection types
-        if char_type in ["Collection", "List", "Set", "SortedSet", "TimeSeries"]:
-            return self._generate_collection_value(char)
-
-        # Handle Either type
-        elif char_type == "Either":
-            return self._generate_either_value(char)
-
-        # Handle Enumeration/State
-        elif char_type in ["Enumeration", "State"]:
-            return self._generate_enumeration_value(char)
-
-        # Handle SingleEntity
-        elif char_type == "SingleEntity" or (char.data_type and self._is_entity(char.data_type)):
-            return self._generate_entity_value(char)
-
-        # Handle MultiLanguageText
-        elif char_type == "MultiLanguageText" or char.data_type == "rdf:langString":
-            return self._generate_multilanguage_value()
-
-        # Handle scalar types
-        else:
-            return self._generate_scalar_value(char)
+        kind = self._kinds.get(id(char))
+        if kind is None:
+            kind = self._kinds[id(char)] = characteristic_kind(char, self._entity_urns)
+        return self._value_builders[kind](char)
 
     def _generate_collection_value(self, char: Characteristic) -> List[Any]:
         """Generate example value for collection characteristics."""
@@ -152,20 +243,15 @@ class JSONInstanceGenerator:
         """Generate example instance for an Entity."""
         instance = {}
 
-        # Handle inheritance
-        if entity.extends:
+        # Handle inheritance; parsed models carry the flattened property list
+        if entity.extends and not entity.all_properties:
             parent_entity = self.model.entities.get(entity.extends)
             if parent_entity:
                 # Include parent properties
                 instance.update(self._generate_entity_instance(parent_entity))
 
-        # Add own properties
-        for prop in entity.properties:
-            if prop.not_in_payload:
-                continue
-
-            prop_name = prop.payload_name or self._get_local_name(prop.urn)
-
+        # Add own and inherited properties
+        for prop, prop_name, _ in self._entity_plan(entity):
             # Use example value if available
             if prop.example_value is not None:
                 instance[prop_name] = self._convert_value(prop.example_value)
@@ -193,67 +279,51 @@ class JSONInstanceGenerator:
     def _generate_default_value_for_type(self, xsd_type: str, index: int = 0) -> Any:
         """Generate a default value based on XSD type."""
         # Remove namespace prefix
-        local_type = xsd_type.split('#')[-1] if '#' in xsd_type else xsd_type.split(':')[-1]
-
-        type_defaults = {
-            # Boolean
-            "boolean": True,
-
-            # String types
-            "string": "example string",
-            "anyURI": "https://example.com/resource",
-            "curie": "ex:Resource",
-            "hexBinary": "48656C6C6F",
-            "base64Binary": "SGVsbG8gV29ybGQ=",
-
-            # Integer types
-            "integer": 42 + index,
-            "int": 42 + index,
-            "long": 1000 + index,
-            "short": 10 + index,
-            "byte": 1 + index,
-            "nonNegativeInteger": 0 + index,
-            "positiveInteger": 1 + index,
-            "unsignedLong": 1000 + index,
-            "unsignedInt": 100 + index,
-            "unsignedShort": 10 + index,
-            "unsignedByte": 1 + index,
-
-            # Number types
-            "decimal": 3.14 + index,
-            "float": 1.5 + index * 0.5,
-            "double": 2.718 + index * 0.1,
-
-            # Date/Time types
-            "date": "2024-01-15",
-            "time": "14:30:00",
-            "dateTime": "2024-01-15T14:30:00Z",
-            "dateTimeStamp": "2024-01-15T14:30:00Z",
-            "gYear": "2024",
-            "gMonth": "--01",
-            "gDay": "---15",
-            "gYearMonth": "2024-01",
-            "gMonthDay": "--01-15",
-            "duration": "P1Y2M3DT4H5M6S",
-            "dayTimeDuration": "P1DT2H",
-            "yearMonthDuration": "P1Y2M",
-        }
+        local_type = xsd_local_name(xsd_type)
+
+        value = _TYPE_DEFAULTS_STATIC.get(local_type)
+        if value is not None:
+            return value
 
-        return type_defaults.get(local_type, "example_value")
+        # Numeric types count up with the item index
+        numeric = _NUMERIC_DEFAULTS.get(local_type)
+        if numeric is not None:
+            base, step = numeric
+            return base + index * step
+
+        return "example_value"
+
+    def _payload_plan(self, owner) -> List[Tuple[Property, str, bool]]:
+        """Return the cached payload plan for an Aspect."""
+        plan = self._payload_plans.get(id(owner))
+        if plan is None:
+            plan = self._payload_plans[id(owner)] = payload_plan(owner.properties)
+        return plan
+
+    def _entity_plan(self, entity: Entity) -> List[Tuple[Property, str, bool]]:
+        """Return the cached payload plan for an Entity, inherited properties included when known."""
+        plan = self._payload_plans.get(id(entity))
+        if plan is None:
+            properties = entity.all_properties if entity.extends and entity.all_properties else entity.properties
+            plan = self._payload_plans[id(entity)] = payload_plan(properties)
+        return plan
 
     def _is_entity(self, type_uri: str) -> bool:
         """Check if a type URI refers to an Entity."""
-        return type_uri in self.model.entities
-
-    def _get_local_name(self, urn: str) -> str:
-        """Extract the local name from a URN."""
-        if '#' in urn:
-            return urn.split('#')[-1]
-        elif '/' in urn:
-            return urn.split('/')[-1]
-        else:
-            return urn
+        return type_uri in self._entity_urns
+
+    def compile_to_python(self) -> Callable[[], Dict[str, Any]]:
+        """Compile the generated JSON instance into a function returning a fresh copy per call.
+
+        The model is traversed once; the returned function only evaluates
+        dict/list literals, so repeated generation for an unchanged model is cheap.
+        """
+        return compile_literal_factory(self.generate(), '<samm_instance>')
 
     def generate_string(self, indent: int = 2) -> str:
         """Generate JSON instance as a formatted JSON string."""
-        return json.dumps(self.generate(), indent=indent, default=str)
+        return dumps_json(self.generate(), indent=indent)
+
+    def write_to_file(self, file_path: str, indent: int = 2):
+        """Write the JSON instance to a file."""
+        dump_json_file(self.generate(), file_path, indent=indent)
@@ -4,25 +4,117 @@ JSON Schema Generator
 Generates JSON Schema from SAMM Aspect Models according to the SAMM specification.
 """
 
-import json
-from typing import Dict, Any, Optional, List
+from collections import Counter, deque
+from types import MappingProxyType
+from typing import Callable, Dict, Any, FrozenSet, Mapping, Optional, List, Tuple
 from .model import (
-    SAMMModel, Aspect, Property, Characteristic, Entity
+    SAMMModel, Aspect, Property, Characteristic, Entity, LocalizedString
 )
+from ._utils import (
+    CharKind, characteristic_kind, local_name, xsd_local_name, payload_plan,
+    copy_json, dumps_json, dump_json_file, compile_literal_factory
+)
+
+
+# Mapping of XSD local type names to JSON Schema type fragments; the fragments are
+# shared and read-only, so they are copied wherever they become part of a schema
+_XSD_JSON_TYPE_MAP = MappingProxyType({
+    # Boolean
+    "boolean": MappingProxyType({"type": "boolean"}),
+
+    # String types
+    "string": MappingProxyType({"type": "string"}),
+    "anyURI": MappingProxyType({"type": "string", "format": "uri"}),
+    "curie": MappingProxyType({"type": "string"}),
+    "hexBinary": MappingProxyType({"type": "string"}),
+    "base64Binary": MappingProxyType({"type": "string", "contentEncoding": "base64"}),
+
+    # Integer types
+    "integer": MappingProxyType({"type": "integer"}),
+    "int": MappingProxyType({"type": "integer"}),
+    "long": MappingProxyType({"type": "integer"}),
+    "short": MappingProxyType({"type": "integer"}),
+    "byte": MappingProxyType({"type": "integer"}),
+    "nonNegativeInteger": MappingProxyType({"type": "integer", "minimum": 0}),
+    "positiveInteger": MappingProxyType({"type": "integer", "minimum": 1}),
+    "unsignedLong": MappingProxyType({"type": "integer", "minimum": 0}),
+    "unsignedInt": MappingProxyType({"type": "integer", "minimum": 0}),
+    "unsignedShort": MappingProxyType({"type": "integer", "minimum": 0}),
+    "unsignedByte": MappingProxyType({"type": "integer", "minimum": 0}),
+
+    # Number types
+    "decimal": MappingProxyType({"type": "number"}),
+    "float": MappingProxyType({"type": "number"}),
+    "double": MappingProxyType({"type": "number"}),
+
+    # Date/Time types
+    "date": MappingProxyType({"type": "string", "format": "date"}),
+    "time": MappingProxyType({"type": "string", "format": "time"}),
+    "dateTime": MappingProxyType({"type": "string", "format": "date-time"}),
+    "dateTimeStamp": MappingProxyType({"type": "string", "format": "date-time"}),
+    "gYear": MappingProxyType({"type": "string"}),
+    "gMonth": MappingProxyType({"type": "string"}),
+    "gDay": MappingProxyType({"type": "string"}),
+    "gYearMonth": MappingProxyType({"type": "string"}),
+    "gMonthDay": MappingProxyType({"type": "string"}),
+    "duration": MappingProxyType({"type": "string"}),
+    "dayTimeDuration": MappingProxyType({"type": "string"}),
+    "yearMonthDuration": MappingProxyType({"type": "string"}),
+})
+
+_DEFAULT_JSON_TYPE = MappingProxyType({"type": "string"})
 
 
 class JSONSchemaGenerator:
     """Generates JSON Schema from SAMM models."""
 
+    __slots__ = (
+        'model', 'definitions', '_entity_urns', '_characteristic_cache', '_payload_plans',
+        '_text_cache', '_pending_entities', '_schema_builders', '_inlined_parents',
+    )
+
     def __init__(self, model: SAMMModel):
         self.model = model
+        # Entity URNs, looked up for every characteristic
+        self._entity_urns = frozenset(model.entities)
         self.definitions = {}
+        # Characteristic schemas already built in this run, keyed by id(characteristic)
+        self._characteristic_cache = {}
+        # Payload plans keyed by id() of the owning Aspect/Entity
+        self._payload_plans = {}
+        # English texts keyed by id() of their LocalizedString
+        self._text_cache = {}
+        # Worklist of (entities, target schema) definitions whose properties are not generated yet
+        self._pending_entities = deque()
+        # Schema builders per characteristic kind
+        self._schema_builders = {
+            CharKind.BOOLEAN: lambda char: {"type": "boolean"},
+            CharKind.COLLECTION: self._generate_collection_schema,
+            CharKind.EITHER: self._generate_either_schema,
+            CharKind.ENUMERATION: self._generate_enumeration_schema,
+            CharKind.ENTITY: self._generate_entity_schema,
+            CharKind.MULTILANG: lambda char: self._generate_multilanguage_schema(),
+            CharKind.SCALAR: self._generate_scalar_schema,
+        }
+        # Parent entities merged into their only child instead of getting an
+        # allOf definition; filled by generate()
+        self._inlined_parents = frozenset()
 
     def generate(self) -> Dict[str, Any]:
         """Generate JSON Schema for the Aspect."""
         if not self.model.aspect:
             raise ValueError("No Aspect found in the model")
 
+        # Start from empty per-run state; the caches are keyed by id() and
+        # would go stale if the model changed since the last run
+        self.definitions = {}
+        self._characteristic_cache.clear()
+        self._payload_plans.clear()
+        self._text_cache.clear()
+        self._pending_entities.clear()
+        self._entity_urns = frozenset(self.model.entities)
+        self._inlined_parents = self._find_inlinable_parents()
+
         schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "type": "object",
@@ -32,27 +124,24 @@ class JSONSchemaGenerator:
 
         # Add aspect description
         if self.model.aspect.description:
-            schema["description"] = self._get_english_text(self.model.aspect.description.values)
+            schema["description"] = self._get_localized_text(self.model.aspect.description)
 
         # Add aspect title
         if self.model.aspect.preferred_name:
-            schema["title"] = self._get_english_text(self.model.aspect.preferred_name.values)
+            schema["title"] = self._get_localized_text(self.model.aspect.preferred_name)
 
         # Generate properties
-        required_props = []
-        for prop in self.model.aspect.properties:
-            if prop.not_in_payload:
-                continue
-
-            prop_name = prop.payload_name or self._get_local_name(prop.urn)
+        plan = self._payload_plan(self.model.aspect)
+        for prop, prop_name, _ in plan:
             schema["properties"][prop_name] = self._generate_property_schema(prop)
 
-            if not prop.optional:
-                required_props.append(prop_name)
-
+        required_props = [prop_name for _, prop_name, optional in plan if not optional]
         if required_props:
             schema["required"] = required_props
 
+        # Generate the entity definitions referenced so far (and those they reference)
+        self._fill_pending_definitions()
+
         # Add definitions for entities
         if self.definitions:
             schema["definitions"] = self.definitions
@@ -65,11 +154,11 @@ class JSONSchemaGenerator:
 
         # Add description
         if prop.description:
-            prop_schema["description"] = self._get_english_text(prop.description.values)
+            prop_schema["description"] = self._get_localized_text(prop.description)
 
         # Add title
         if prop.preferred_name:
-            prop_schema["title"] = self._get_english_text(prop.preferred_name.values)
+            prop_schema["title"] = self._get_localized_text(prop.preferred_name)
 
         # Generate schema based on characteristic
         if prop.characteristic:
@@ -80,35 +169,16 @@ class JSONSchemaGenerator:
 
     def _generate_characteristic_schema(self, char: Characteristic) -> Dict[str, Any]:
         """Generate schema for a characteristic."""
-        char_type = char.characteristic_type
-
-        # Handle Boolean
-        if char_type == "Boolean":
-            return {"type": "boolean"}
-
-        # Handle collection types
-        elif char_type in ["Collection", "List", "Set", "SortedSet", "TimeSeries"]:
-            return self._generate_collection_schema(char)
-
-        # Handle Either type
-        elif char_type == "Either":
-            return self._generate_either_schema(char)
-
-        # Handle Enumeration/State
-        elif char_type in ["Enumeration", "State"]:
-            return self._generate_enumeration_schema(char)
+        # Characteristics are shared by reference between properties; each
+        # caller gets its own copy so no nested object is shared between them
+        cached = self._characteristic_cache.get(id(char))
+        if cached is None:
+            cached = self._characteristic_cache[id(char)] = self._build_characteristic_schema(char)
+        return copy_json(cached)
 
-        # Handle SingleEntity
-        elif char_type == "SingleEntity" or (char.data_type and self._is_entity(char.data_type)):
-            return self._generate_entity_schema(char)
-
-        # Handle MultiLanguageText
-        elif char_type == "MultiLanguageText" or char.data_type == "rdf:langString":
-            return self._generate_multilanguage_schema()
-
-        # Handle scalar types
-        else:
-            return self._generate_scalar_schema(char)
+    def _build_characteristic_schema(self, char: Characteristic) -> Dict[str, Any]:
+        """Build the schema for a characteristic, dispatching on its kind."""
+        return self._schema_builders[characteristic_kind(char, self._entity_urns)](char)
 
     def _generate_collection_schema(self, char: Characteristic) -> Dict[str, Any]:
         """Generate schema for collection characteristics."""
@@ -119,14 +189,10 @@ class JSONSchemaGenerator:
         elif char.data_type:
             # Check if dataType is an Entity
             if self._is_entity(char.data_type):
-                entity_name = self._get_local_name(char.data_type)
-                if entity_name not in self.definitions:
-                    entity = self.model.entities.get(char.data_type)
-                    if entity:
-                        self.definitions[entity_name] = self._generate_entity_definition(entity)
+                entity_name = self._ensure_entity_definition(char.data_type)
                 schema["items"] = {"$ref": f"#/definitions/{entity_name}"}
             else:
-                schema["items"] = self._xsd_to_json_type(char.data_type)
+                schema["items"] = dict(self._xsd_to_json_type(char.data_type))
 
         # For Set and SortedSet, add uniqueItems
         if char.characteristic_type in ["Set", "SortedSet"]:
@@ -165,9 +231,9 @@ class JSONSchemaGenerator:
 
         # Try to infer type from values or dataType
         if char.data_type:
-            base_type = self._xsd_to_json_type(char.data_type)
-            if "type" in base_type:
-                schema["type"] = base_type["type"]
+            json_type = self._xsd_to_json_type(char.data_type).get("type")
+            if json_type is not None:
+                schema["type"] = json_type
 
         return schema
 
@@ -178,68 +244,118 @@ class JSONSchemaGenerator:
         if not entity_urn or not self._is_entity(entity_urn):
             return {"type": "object"}
 
-        # Check if entity is already in definitions
-        entity_name = self._get_local_name(entity_urn)
-
-        if entity_name not in self.definitions:
-            entity = self.model.entities.get(entity_urn)
-            if entity:
-                self.definitions[entity_name] = self._generate_entity_definition(entity)
+        entity_name = self._ensure_entity_definition(entity_urn)
 
         return {"$ref": f"#/definitions/{entity_name}"}
 
-    def _generate_entity_definition(self, entity: Entity) -> Dict[str, Any]:
-        """Generate schema definition for an Entity."""
-        entity_schema = {
-            "type": "object",
-            "properties": {}
-        }
-
-        if entity.description:
-            entity_schema["description"] = self._get_english_text(entity.description.values)
+    def _ensure_entity_definition(self, entity_urn: str) -> str:
+        """Add the Entity to definitions if not present and return its definition name."""
+        entity = self.model.entities.get(entity_urn)
+        entity_name = entity.local_name if entity else self._get_local_name(entity_urn)
+
+        if entity and entity_name not in self.definitions:
+            # Register a placeholder first so that references reached while
+            # building the definition (e.g. cyclic extends) see it as present
+            self.definitions[entity_name] = {}
+            self._generate_entity_definition(entity, self.definitions[entity_name])
+
+        return entity_name
+
+    def _generate_entity_definition(self, entity: Entity, entity_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate schema definition for an Entity into entity_schema.
+
+        Only the outer structure is built here; the entity is queued and its
+        properties are added by _fill_pending_definitions(), so nested and
+        cyclic entity references do not recurse. A parent that no other
+        entity or characteristic refers to is merged into the definition
+        instead of being combined via allOf.
+        """
+        # Collect the ancestors whose properties are merged into this definition
+        chain = [entity]
+        base = entity
+        while base.extends in self._inlined_parents and all(e.urn != base.extends for e in chain):
+            base = self.model.entities[base.extends]
+            chain.append(base)
+        chain.reverse()
+
+        parent_entity = self.model.entities.get(base.extends) if base.extends else None
 
         # Handle inheritance
-        if entity.extends:
-            parent_entity = self.model.entities.get(entity.extends)
-            if parent_entity:
-                parent_name = self._get_local_name(entity.extends)
-                if parent_name not in self.definitions:
-                    self.definitions[parent_name] = self._generate_entity_definition(parent_entity)
-
-                # Use allOf to combine parent and current entity
-                entity_schema = {
-                    "allOf": [
-                        {"$ref": f"#/definitions/{parent_name}"},
-                        {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ]
+        if parent_entity:
+            parent_name = parent_entity.local_name
+
+            # Use allOf to combine parent and current entity
+            entity_schema["allOf"] = [
+                {"$ref": f"#/definitions/{parent_name}"},
+                {
+                    "type": "object",
+                    "properties": {}
                 }
-                # Add properties to the second element
-                target_schema = entity_schema["allOf"][1]
-            else:
-                target_schema = entity_schema
+            ]
+            # Add properties to the second element
+            target_schema = entity_schema["allOf"][1]
         else:
+            entity_schema["type"] = "object"
+            entity_schema["properties"] = {}
             target_schema = entity_schema
 
-        # Add properties
-        required_props = []
-        for prop in entity.properties:
-            if prop.not_in_payload:
-                continue
-
-            prop_name = prop.payload_name or self._get_local_name(prop.urn)
-            target_schema["properties"][prop_name] = self._generate_property_schema(prop)
+            if entity.description:
+                entity_schema["description"] = self._get_localized_text(entity.description)
 
-            if not prop.optional:
-                required_props.append(prop_name)
+        self._pending_entities.append((chain, target_schema))
 
-        if required_props:
-            target_schema["required"] = required_props
+        if parent_entity:
+            self._ensure_entity_definition(base.extends)
 
         return entity_schema
 
+    def _fill_pending_definitions(self):
+        """Add the properties of queued entity definitions until the worklist is empty."""
+        while self._pending_entities:
+            entities, target_schema = self._pending_entities.popleft()
+
+            # Inlined ancestors come first, as in the generated instances
+            required_props = []
+            for entity in entities:
+                plan = self._payload_plan(entity)
+                for prop, prop_name, _ in plan:
+                    target_schema["properties"][prop_name] = self._generate_property_schema(prop)
+                required_props.extend(prop_name for _, prop_name, optional in plan if not optional)
+
+            if required_props:
+                target_schema["required"] = required_props
+
+    def _find_inlinable_parents(self) -> FrozenSet[str]:
+        """Find parent entities that are extended exactly once and not used as a data type."""
+        entities = self.model.entities
+        extends_count = Counter(entity.extends for entity in entities.values() if entity.extends)
+
+        # Data types of every characteristic reachable from the model
+        stack = list(self.model.characteristics.values())
+        for owner in list(entities.values()) + [self.model.aspect] + list(self.model.properties.values()):
+            if owner is None:
+                continue
+            if isinstance(owner, Property):
+                stack.append(owner.characteristic)
+            else:
+                stack.extend(prop.characteristic for prop in owner.properties)
+
+        data_types = set()
+        seen = set()
+        while stack:
+            char = stack.pop()
+            if char is None or id(char) in seen:
+                continue
+            seen.add(id(char))
+            data_types.add(char.data_type)
+            stack.extend((char.element_characteristic, char.left, char.right))
+            stack.extend(prop.characteristic for prop in char.elements)
+
+        return frozenset(
+            urn for urn, count in extends_count.items()
+            if count == 1 and urn in entities and urn not in data_types
+        )
+
     def _generate_multilanguage_schema(self) -> Dict[str, Any]:
         """Generate schema for MultiLanguageText."""
         return {
@@ -254,85 +370,63 @@ class JSONSchemaGenerator:
 
     def _generate_scalar_schema(self, char: Characteristic) -> Dict[str, Any]:
         """Generate schema for scalar characteristics."""
-        schema = {}
-
-        if char.data_type:
-            schema.update(self._xsd_to_json_type(char.data_type))
+        schema = dict(self._xsd_to_json_type(char.data_type)) if char.data_type else {}
 
         # Add description if available
         if char.description:
-            schema["description"] = self._get_english_text(char.description.values)
+            schema["description"] = self._get_localized_text(char.description)
 
         return schema
 
-    def _xsd_to_json_type(self, xsd_type: str) -> Dict[str, Any]:
-        """Map XSD data types to JSON Schema types."""
-        # Remove namespace prefix
-        local_type = xsd_type.split('#')[-1] if '#' in xsd_type else xsd_type.split(':')[-1]
-
-        type_mapping = {
-            # Boolean
-            "boolean": {"type": "boolean"},
-
-            # String types
-            "string": {"type": "string"},
-            "anyURI": {"type": "string", "format": "uri"},
-            "curie": {"type": "string"},
-            "hexBinary": {"type": "string"},
-            "base64Binary": {"type": "string", "contentEncoding": "base64"},
-
-            # Integer types
-            "integer": {"type": "integer"},
-            "int": {"type": "integer"},
-            "long": {"type": "integer"},
-            "short": {"type": "integer"},
-            "byte": {"type": "integer"},
-            "nonNegativeInteger": {"type": "integer", "minimum": 0},
-            "positiveInteger": {"type": "integer", "minimum": 1},
-            "unsignedLong": {"type": "integer", "minimum": 0},
-            "unsignedInt": {"type": "integer", "minimum": 0},
-            "unsignedShort": {"type": "integer", "minimum": 0},
-            "unsignedByte": {"type": "integer", "minimum": 0},
-
-            # Number types
-            "decimal": {"type": "number"},
-            "float": {"type": "number"},
-            "double": {"type": "number"},
-
-            # Date/Time types
-            "date": {"type": "string", "format": "date"},
-            "time": {"type": "string", "format": "time"},
-            "dateTime": {"type": "string", "format": "date-time"},
-            "dateTimeStamp": {"type": "string", "format": "date-time"},
-            "gYear": {"type": "string"},
-            "gMonth": {"type": "string"},
-            "gDay": {"type": "string"},
-            "gYearMonth": {"type": "string"},
-            "gMonthDay": {"type": "string"},
-            "duration": {"type": "string"},
-            "dayTimeDuration": {"type": "string"},
-            "yearMonthDuration": {"type": "string"},
-        }
+    def _xsd_to_json_type(self, xsd_type: str) -> Mapping[str, Any]:
+        """Map XSD data types to JSON Schema types (a shared, read-only mapping)."""
+        return _XSD_JSON_TYPE_MAP.get(xsd_local_name(xsd_type), _DEFAULT_JSON_TYPE)
 
-        return type_mapping.get(local_type, {"type": "string"})
+    def _payload_plan(self, owner) -> List[Tuple[Property, str, bool]]:
+        """Return the cached payload plan for an Aspect or Entity."""
+        plan = self._payload_plans.get(id(owner))
+        if plan is None:
+            plan = self._payload_plans[id(owner)] = payload_plan(owner.properties)
+        return plan
 
     def _is_entity(self, type_uri: str) -> bool:
         """Check if a type URI refers to an Entity."""
-        return type_uri in self.model.entities
+        return type_uri in self._entity_urns
 
     def _get_local_name(self, urn: str) -> str:
         """Extract the local name from a URN."""
-        if '#' in urn:
-            return urn.split('#')[-1]
-        elif '/' in urn:
-            return urn.split('/')[-1]
-        else:
-            return urn
+        return local_name(urn)
+
+    def _get_localized_text(self, localized: LocalizedString) -> str:
+        """Get the English text of a LocalizedString, computed once per object."""
+        text = self._text_cache.get(id(localized))
+        if text is None:
+            text = self._text_cache[id(localized)] = self._get_english_text(localized.values)
+        return text
 
     def _get_english_text(self, lang_dict: Dict[str, str]) -> str:
         """Get English text from a language dictionary."""
-        return lang_dict.get('en', lang_dict.get('', list(lang_dict.values())[0] if lang_dict else ''))
+        # Fall back to the untagged text, then to the first available language
+        text = lang_dict.get('en')
+        if text is not None:
+            return text
+        text = lang_dict.get('')
+        if text is not None:
+            return text
+        return next(iter(lang_dict.values()), '')
+
+    def compile_to_python(self) -> Callable[[], Dict[str, Any]]:
+        """Compile the generated JSON Schema into a function returning a fresh copy per call.
+
+        The model is traversed once; the returned function only evaluates
+        dict/list literals, so repeated generation for an unchanged model is cheap.
+        """
+        return compile_literal_factory(self.generate(), '<samm_schema>')
 
     def generate_string(self, indent: int = 2) -> str:
         """Generate JSON Schema as a formatted JSON string."""
-        return json.dumps(self.generate(), indent=indent)
+        return dumps_json(self.generate(), indent=indent)
+
+    def write_to_file(self, file_path: str, indent: int = 2):
+        """Write the JSON Schema to a file."""
+        dump_json_file(self.generate(), file_path, indent=indent)
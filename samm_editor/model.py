@@ -4,17 +4,23 @@ SAMM Model Data Structures
 Defines Python classes for representing SAMM model elements.
 """
 
+import sys
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
+from ._utils import local_name as _local_name
 
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LocalizedString:
     """A string with language tags (rdf:langString)."""
     values: Dict[str, str] = field(default_factory=dict)  # lang -> text
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ModelElement:
     """Base class for all SAMM model elements."""
     urn: str
@@ -22,8 +28,13 @@ class ModelElement:
     description: Optional[LocalizedString] = None
     see: List[str] = field(default_factory=list)
 
+    @property
+    def local_name(self) -> str:
+        """Local part of the URN; always follows urn (the lookup is cached per URN)."""
+        return _local_name(self.urn)
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Characteristic(ModelElement):
     """A Characteristic describes the semantics of a Property."""
     data_type: Optional[str] = None
@@ -48,7 +59,7 @@ class Characteristic(ModelElement):
     elements: List['Property'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Property(ModelElement):
     """A Property represents a named value."""
     characteristic: Optional[Characteristic] = None
@@ -58,28 +69,30 @@ class Property(ModelElement):
     not_in_payload: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Entity(ModelElement):
     """An Entity is a logical encapsulation of multiple values."""
     properties: List[Property] = field(default_factory=list)
     extends: Optional[str] = None  # URN of parent entity
     is_abstract: bool = False
+    # Inherited and own properties, parents first; filled in by the parser
+    all_properties: List[Property] = field(default_factory=list, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Operation(ModelElement):
     """An Operation represents an action that can be triggered."""
     input_properties: List[Property] = field(default_factory=list)
     output_property: Optional[Property] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Event(ModelElement):
     """An Event represents a single occurrence where timing is important."""
     parameters: List[Property] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Aspect(ModelElement):
     """An Aspect is the root element of an Aspect Model."""
     properties: List[Property] = field(default_factory=list)
@@ -87,7 +100,7 @@ class Aspect(ModelElement):
     events: List[Event] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SAMMModel:
     """Container for a complete SAMM Aspect Model."""
     aspect: Optional[Aspect] = None
@@ -4,9 +4,22 @@ SAMM Turtle Parser
 Parses Turtle files containing SAMM Aspect Models and converts them to Python objects.
 """
 
+import dataclasses
+import os
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+
 from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef
 from rdflib.namespace import XSD
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Set, Iterable, Iterator, Tuple
+
+try:
+    import oxrdflib  # noqa: F401 - registers the Oxigraph store and ox-turtle parser
+except ImportError:
+    oxrdflib = None  # type: ignore[assignment]
+
 from .model import (
     SAMMModel, Aspect, Property, Characteristic, Entity, Operation, Event,
     LocalizedString, ModelElement
@@ -19,33 +32,168 @@ SAMM_C = Namespace("urn:samm:org.eclipse.esmf.samm:characteristic:2.2.0#")
 SAMM_E = Namespace("urn:samm:org.eclipse.esmf.samm:entity:2.2.0#")
 UNIT = Namespace("urn:samm:org.eclipse.esmf.samm:unit:2.2.0#")
 
+# Version part of a SAMM meta-model namespace
+_META_MODEL_VERSION_RE = re.compile(r'org\.eclipse\.esmf\.samm:meta-model:(.*?)#*$')
+
+# Local names of the samm-c characteristic classes
+_CHARACTERISTIC_TYPE_NAMES = (
+    "Measurement", "Quantifiable", "Enumeration", "State", "Collection", "List", "Set",
+    "SortedSet", "TimeSeries", "Either", "StructuredValue", "SingleEntity", "Trait", "Code",
+    "Duration", "Boolean", "Text", "MultiLanguageText", "Timestamp", "UnitReference",
+)
+
+# Meta-model and characteristic terms read by the parser
+_SAMM_TERM_NAMES = (
+    "Aspect", "Entity", "AbstractEntity", "Property", "Characteristic",
+    "properties", "operations", "events", "property", "payloadName", "optional", "notInPayload",
+    "characteristic", "exampleValue", "dataType", "extends", "input", "output", "parameters",
+    "preferredName", "description", "see",
+)
+_SAMM_C_TERM_NAMES = (
+    "unit", "values", "defaultValue", "elementCharacteristic", "left", "right",
+    "deconstructionRule", "elements",
+)
+
+
+# Default for predicate lookups in the triple index: one missing object
+_NO_VALUE = (None,)
+
+
+def _urn(node) -> str:
+    """Return the interned string form of a URI, so each URN is stored once per model."""
+    return sys.intern(str(node))
+
+
+def _literal_to_bool(literal) -> bool:
+    """Read an xsd:boolean flag from its typed value rather than the literal's truthiness."""
+    value = literal.toPython() if isinstance(literal, Literal) else literal
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', '1')
+
+
+def _literal_values(nodes: Iterable[Any]) -> List[Any]:
+    """Convert a run of list items like SAMMParser._literal_to_python, in one loop."""
+    values: List[Any] = []
+    append = values.append
+    for node in nodes:
+        if isinstance(node, Literal):
+            value = node.value
+            append(node if value is None else value)
+        else:
+            append(str(node))
+    return values
+
+
+@lru_cache(maxsize=None)
+def _samm_namespaces(version: str) -> Tuple[Namespace, Namespace, Namespace, Namespace]:
+    """Return the samm, samm-c, samm-e and unit namespaces of a SAMM version."""
+    return (
+        Namespace(f"urn:samm:org.eclipse.esmf.samm:meta-model:{version}#"),
+        Namespace(f"urn:samm:org.eclipse.esmf.samm:characteristic:{version}#"),
+        Namespace(f"urn:samm:org.eclipse.esmf.samm:entity:{version}#"),
+        Namespace(f"urn:samm:org.eclipse.esmf.samm:unit:{version}#"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _characteristic_type_names(samm_c: Namespace) -> Mapping[URIRef, str]:
+    """Map the samm-c characteristic class URIs of a namespace to their local names."""
+    return MappingProxyType({samm_c[name]: name for name in _CHARACTERISTIC_TYPE_NAMES})
+
+
+@lru_cache(maxsize=None)
+def _namespace_terms(namespace: str, names: Tuple[str, ...]) -> SimpleNamespace:
+    """Build the URIRefs of a namespace once, so lookups skip Namespace.__getattr__."""
+    return SimpleNamespace(**{name: URIRef(namespace + name) for name in names})
+
+
+# Data types implied by predefined samm-c characteristics
+# (UnitReference implies samm:curie, which depends on the SAMM version)
+_PREDEFINED_DATATYPES = {
+    "Boolean": str(XSD.boolean),
+    "Text": str(XSD.string),
+    "Timestamp": str(XSD.dateTime),
+    "MultiLanguageText": str(RDF.langString),
+    "Locale": str(XSD.string),
+    "Language": str(XSD.string),
+    "MimeType": str(XSD.string),
+    "ResourcePath": str(XSD.anyURI),
+}
+
 
 class SAMMParser:
     """Parser for SAMM Turtle files."""
 
-    def __init__(self):
-        self.graph = Graph()
+    def __init__(self, fast: Optional[bool] = None, parse_orphans: bool = True):
+        # With fast=True and oxrdflib installed, Turtle is parsed by Oxigraph;
+        # by default this follows SAMM_PARSER_BACKEND=oxigraph
+        if fast is None:
+            fast = os.environ.get('SAMM_PARSER_BACKEND', '').lower() == 'oxigraph'
+        self._fast = fast and oxrdflib is not None
+        self._turtle_format = 'ox-turtle' if self._fast else 'turtle'
+        # With parse_orphans=False, only characteristics reachable from
+        # model elements are parsed
+        self._parse_orphans = parse_orphans
+        self._reset()
+
+    def _reset(self) -> None:
+        """Start from a fresh graph and model, so every parse call is independent."""
+        # The loaded graph while parsing, None once the model is built
+        self.graph: Any = Graph(store='Oxigraph') if self._fast else Graph()
         self.model = SAMMModel()
         # These will be set dynamically based on detected version
-        self.samm = None
-        self.samm_c = None
-        self.samm_e = None
-        self.unit = None
+        self.samm: Optional[Namespace] = None
+        self.samm_c: Optional[Namespace] = None
+        self.samm_e: Optional[Namespace] = None
+        self.unit: Optional[Namespace] = None
+        # samm-c characteristic class URI -> local name, for the detected version
+        self._char_type_names: Mapping[URIRef, str] = {}
+        # Precomputed samm: and samm-c: terms, for the detected version
+        self._samm_terms: Any = None
+        self._samm_c_terms: Any = None
+        self._samm_c_prefix = ""
+        self._samm_curie = ""
+        # Triple indexes, filled once per parse by _build_indexes
+        self._po: Dict[Any, Dict[URIRef, List[Any]]] = {}
+        self._types: Dict[Any, Set[URIRef]] = {}
+        self._subjects_by_type: Dict[URIRef, List[Any]] = {}
+        # Decoded preferredName/description texts per subject (lang -> text)
+        self._preferred_names: Dict[Any, Dict[str, str]] = {}
+        self._descriptions: Dict[Any, Dict[str, str]] = {}
+        # Parsed characteristics by URN, shared by all references
+        self._char_cache: Dict[str, Characteristic] = {}
+        # Parsed properties by URN; references with overrides get a copy
+        self._prop_cache: Dict[str, Property] = {}
 
     def parse_file(self, file_path: str) -> SAMMModel:
         """Parse a Turtle file and return a SAMMModel."""
-        self.graph.parse(file_path, format='turtle')
-        self._extract_namespaces()
-        self._detect_samm_version()
-        self._parse_model()
-        return self.model
+        self._reset()
+        self.graph.parse(file_path, format=self._turtle_format)
+        return self._build_model()
 
     def parse_string(self, turtle_content: str) -> SAMMModel:
         """Parse Turtle content from a string and return a SAMMModel."""
-        self.graph.parse(data=turtle_content, format='turtle')
+        self._reset()
+        self.graph.parse(data=turtle_content, format=self._turtle_format)
+        return self._build_model()
+
+    def _build_model(self) -> SAMMModel:
+        """Build the model from the loaded graph, then release the graph and indexes."""
         self._extract_namespaces()
         self._detect_samm_version()
+        self._build_indexes()
         self._parse_model()
+
+        # The model holds plain Python values only; let the RDF terms be collected
+        self.graph = None
+        self._po = {}
+        self._types = {}
+        self._subjects_by_type = {}
+        self._preferred_names = {}
+        self._descriptions = {}
+        self._char_cache = {}
+        self._prop_cache = {}
         return self.model
 
     def _extract_namespaces(self):
@@ -58,307 +206,437 @@ class SAMMParser:
 
     def _detect_samm_version(self):
         """Detect SAMM version from namespaces and set appropriate namespace objects."""
-        # Look for samm, samm-c, samm-e prefixes in the graph
+        # Look for the samm meta-model namespace in the graph
         detected_version = "2.2.0"  # default
 
         for prefix, namespace in self.graph.namespaces():
-            namespace_str = str(namespace)
-            # Check for SAMM meta-model namespace
-            if 'org.eclipse.esmf.samm:meta-model:' in namespace_str:
-                # Extract version from namespace
-                version_part = namespace_str.split(':meta-model:')[1].rstrip('#')
-                detected_version = version_part
+            match = _META_MODEL_VERSION_RE.search(namespace)
+            if match:
+                detected_version = match.group(1)
                 break
 
         # Set namespace objects based on detected version
-        self.samm = Namespace(f"urn:samm:org.eclipse.esmf.samm:meta-model:{detected_version}#")
-        self.samm_c = Namespace(f"urn:samm:org.eclipse.esmf.samm:characteristic:{detected_version}#")
-        self.samm_e = Namespace(f"urn:samm:org.eclipse.esmf.samm:entity:{detected_version}#")
-        self.unit = Namespace(f"urn:samm:org.eclipse.esmf.samm:unit:{detected_version}#")
-
-        print(f"Detected SAMM version: {detected_version}")
+        self.samm, self.samm_c, self.samm_e, self.unit = _samm_namespaces(detected_version)
+        self._char_type_names = _characteristic_type_names(self.samm_c)
+        self._samm_terms = _namespace_terms(str(self.samm), _SAMM_TERM_NAMES)
+        self._samm_c_prefix = str(self.samm_c)
+        self._samm_curie = str(self.samm) + "curie"
+        self._samm_c_terms = _namespace_terms(self._samm_c_prefix, _SAMM_C_TERM_NAMES)
+
+    def _build_indexes(self):
+        """Index the graph once so element parsing never queries the store again."""
+        graph = self.graph
+        po = {}
+        preferred_names = {}
+        descriptions = {}
+        # Localized texts are decoded to lang -> text while indexing
+        localized = {
+            self._samm_terms.preferredName: preferred_names,
+            self._samm_terms.description: descriptions,
+        }
+        # Walk subject by subject: the store keeps per-subject triples in
+        # parse order, which keeps multi-valued attributes deterministic
+        for subject in graph.subjects(unique=True):
+            predicates = po[subject] = {}
+            for predicate, obj in graph.predicate_objects(subject):
+                objects = predicates.get(predicate)
+                if objects is None:
+                    predicates[predicate] = [obj]
+                else:
+                    objects.append(obj)
+                texts = localized.get(predicate)
+                if texts is not None and isinstance(obj, Literal):
+                    texts.setdefault(subject, {})[obj.language or 'en'] = str(obj)
+        self._po = po
+        self._preferred_names = preferred_names
+        self._descriptions = descriptions
+        self._types = {
+            subject: set(predicates[RDF.type])
+            for subject, predicates in po.items() if RDF.type in predicates
+        }
+
+        # Subjects per type, in the same order as graph.subjects(RDF.type, T)
+        subjects_by_type = {}
+        for subject, rdf_type in graph.subject_objects(RDF.type):
+            subjects_by_type.setdefault(rdf_type, []).append(subject)
+        self._subjects_by_type = subjects_by_type
+
+    def _objects(self, subject, predicate) -> Iterable[Any]:
+        """Return all objects for subject and predicate, like graph.objects."""
+        return self._po.get(subject, {}).get(predicate, ())
+
+    def _list_items(self, head) -> Iterator[Any]:
+        """Iterate over the items of an RDF list, like graph.items."""
+        po = self._po
+        seen = {head}
+        while head:
+            predicates = po.get(head)
+            if predicates is None:
+                return
+            first = predicates.get(RDF.first)
+            if first:
+                yield first[0]
+            rest = predicates.get(RDF.rest)
+            if not rest:
+                return
+            head = rest[0]
+            if head in seen:
+                raise ValueError("List contains a recursive rdf:rest reference")
+            seen.add(head)
 
     def _parse_model(self):
         """Parse all model elements from the RDF graph."""
+        subjects_by_type = self._subjects_by_type
+        terms = self._samm_terms
+        model = self.model
+        entities = model.entities
+        characteristics = model.characteristics
+        properties = model.properties
+
         # Parse Aspects
-        for aspect_uri in self.graph.subjects(RDF.type, self.samm.Aspect):
-            self.model.aspect = self._parse_aspect(aspect_uri)
+        for aspect_uri in subjects_by_type.get(terms.Aspect, ()):
+            model.aspect = self._parse_aspect(aspect_uri)
 
         # Parse Entities
-        for entity_uri in self.graph.subjects(RDF.type, self.samm.Entity):
-            entity = self._parse_entity(entity_uri)
-            self.model.entities[str(entity_uri)] = entity
+        parse_entity = self._parse_entity
+        for entity_uri in subjects_by_type.get(terms.Entity, ()):
+            entity = parse_entity(entity_uri)
+            entities[entity.urn] = entity
 
         # Parse Abstract Entities
-        for entity_uri in self.graph.subjects(RDF.type, self.samm.AbstractEntity):
-            entity = self._parse_entity(entity_uri, is_abstract=True)
-            self.model.entities[str(entity_uri)] = entity
+        for entity_uri in subjects_by_type.get(terms.AbstractEntity, ()):
+            entity = parse_entity(entity_uri, is_abstract=True)
+            entities[entity.urn] = entity
 
         # Parse Characteristics
-        for char_uri in self._find_all_characteristics():
-            if str(char_uri) not in self.model.characteristics:
-                characteristic = self._parse_characteristic(char_uri)
-                self.model.characteristics[str(char_uri)] = characteristic
+        if self._parse_orphans:
+            parse_characteristic = self._parse_characteristic
+            for char_uri in self._find_all_characteristics():
+                char_urn = _urn(char_uri)
+                if char_urn not in characteristics:
+                    characteristics[char_urn] = parse_characteristic(char_uri)
 
         # Parse standalone Properties (not part of Aspect/Entity)
-        for prop_uri in self.graph.subjects(RDF.type, self.samm.Property):
-            if str(prop_uri) not in self.model.properties:
-                prop = self._parse_property(prop_uri)
-                self.model.properties[str(prop_uri)] = prop
-
-    def _find_all_characteristics(self) -> List[URIRef]:
-        """Find all characteristic URIs in the graph."""
-        characteristics = set()
-
-        # Find all subjects that are typed as Characteristic or its subclasses
-        char_types = [
-            self.samm.Characteristic,
-            self.samm_c.Measurement,
-            self.samm_c.Quantifiable,
-            self.samm_c.Enumeration,
-            self.samm_c.State,
-            self.samm_c.Collection,
-            self.samm_c.List,
-            self.samm_c.Set,
-            self.samm_c.SortedSet,
-            self.samm_c.TimeSeries,
-            self.samm_c.Either,
-            self.samm_c.StructuredValue,
-            self.samm_c.SingleEntity,
-            self.samm_c.Trait,
-            self.samm_c.Code,
-            self.samm_c.Duration,
-            self.samm_c.Boolean,
-            self.samm_c.Text,
-            self.samm_c.MultiLanguageText,
-            self.samm_c.Timestamp,
-            self.samm_c.UnitReference,
-        ]
-
-        for char_type in char_types:
-            for char_uri in self.graph.subjects(RDF.type, char_type):
-                characteristics.add(char_uri)
+        parse_property = self._parse_property
+        for prop_uri in subjects_by_type.get(terms.Property, ()):
+            prop_urn = _urn(prop_uri)
+            if prop_urn not in properties:
+                properties[prop_urn] = parse_property(prop_uri)
+
+        if not self._parse_orphans:
+            # Register every characteristic reached while parsing, nested ones included
+            for char_urn, characteristic in self._char_cache.items():
+                characteristics.setdefault(char_urn, characteristic)
+
+        self._flatten_inheritance()
+
+    def _flatten_inheritance(self):
+        """Set each entity's all_properties from its extends chain, resolving every entity once."""
+        entities = self.model.entities
+        resolved: Dict[str, List[Property]] = {}
+        for entity in entities.values():
+            # Walk up to the first resolved ancestor, a missing parent or a cycle
+            chain = []
+            chain_urns = set()
+            current = entity
+            while current is not None and current.urn not in resolved and current.urn not in chain_urns:
+                chain.append(current)
+                chain_urns.add(current.urn)
+                current = entities.get(current.extends) if current.extends else None
+
+            inherited = resolved.get(current.urn, []) if current is not None else []
+            for member in reversed(chain):
+                inherited = inherited + member.properties
+                member.all_properties = resolved[member.urn] = inherited
+
+    def _find_all_characteristics(self) -> Iterator[URIRef]:
+        """Yield each characteristic URI in the graph once, in document order."""
+        seen: Set[URIRef] = set()
+        add = seen.add
+        terms = self._samm_terms
+        characteristic_class = terms.Characteristic
+        char_type_names = self._char_type_names
+
+        # Find all subjects that are typed as Characteristic or its subclasses,
+        # in one pass over the type index
+        for rdf_type, subjects in self._subjects_by_type.items():
+            if rdf_type != characteristic_class and rdf_type not in char_type_names:
+                continue
+            for char_uri in subjects:
+                if char_uri not in seen:
+                    add(char_uri)
+                    yield char_uri
 
         # Also find characteristics referenced by properties
-        for prop_uri in self.graph.subjects(RDF.type, self.samm.Property):
-            char_uri = self.graph.value(prop_uri, self.samm.characteristic)
-            if char_uri:
-                characteristics.add(char_uri)
-
-        return list(characteristics)
+        po = self._po
+        characteristic = terms.characteristic
+        for prop_uri in self._subjects_by_type.get(terms.Property, ()):
+            char_uri = po.get(prop_uri, {}).get(characteristic, _NO_VALUE)[0]
+            if char_uri and char_uri not in seen:
+                add(char_uri)
+                yield char_uri
 
     def _parse_aspect(self, aspect_uri: URIRef) -> Aspect:
         """Parse an Aspect element."""
-        aspect = Aspect(urn=str(aspect_uri))
+        aspect = Aspect(urn=_urn(aspect_uri))
         self._parse_common_attributes(aspect_uri, aspect)
+        predicates = self._po.get(aspect_uri, {})
+        terms = self._samm_terms
 
         # Parse properties
-        properties_list = self.graph.value(aspect_uri, self.samm.properties)
+        properties_list = predicates.get(terms.properties, _NO_VALUE)[0]
         if properties_list:
             aspect.properties = self._parse_property_list(properties_list)
 
         # Parse operations
-        operations_list = self.graph.value(aspect_uri, self.samm.operations)
+        operations_list = predicates.get(terms.operations, _NO_VALUE)[0]
         if operations_list:
-            for op_uri in self.graph.items(operations_list):
+            for op_uri in self._list_items(operations_list):
                 operation = self._parse_operation(op_uri)
                 aspect.operations.append(operation)
-                self.model.operations[str(op_uri)] = operation
+                self.model.operations[operation.urn] = operation
 
         # Parse events
-        events_list = self.graph.value(aspect_uri, self.samm.events)
+        events_list = predicates.get(terms.events, _NO_VALUE)[0]
         if events_list:
-            for event_uri in self.graph.items(events_list):
+            for event_uri in self._list_items(events_list):
                 event = self._parse_event(event_uri)
                 aspect.events.append(event)
-                self.model.events[str(event_uri)] = event
+                self.model.events[event.urn] = event
 
         return aspect
 
     def _parse_property_list(self, properties_list) -> List[Property]:
         """Parse a list of properties (RDF Collection)."""
         properties = []
-        for item in self.graph.items(properties_list):
+        terms = self._samm_terms
+        property_class = terms.Property
+        types = self._types
+        po = self._po
+        parse_property = self._parse_property
+        for item in self._list_items(properties_list):
             # Item can be a Property URI or a blank node with property + payloadName
-            if (item, RDF.type, self.samm.Property) in self.graph:
-                prop = self._parse_property(item)
+            if property_class in types.get(item, ()):
+                prop = parse_property(item)
             else:
                 # Blank node with samm:property and optional samm:payloadName
-                prop_uri = self.graph.value(item, self.samm.property)
+                item_predicates = po.get(item, {})
+                prop_uri = item_predicates.get(terms.property, _NO_VALUE)[0]
                 if prop_uri:
-                    prop = self._parse_property(prop_uri)
+                    # Copy the shared property before applying the overrides
+                    prop = dataclasses.replace(parse_property(prop_uri))
                     # Check for payloadName override
-                    payload_name = self.graph.value(item, self.samm.payloadName)
+                    payload_name = item_predicates.get(terms.payloadName, _NO_VALUE)[0]
                     if payload_name:
                         prop.payload_name = str(payload_name)
                     # Check for optional override
-                    optional = self.graph.value(item, self.samm.optional)
-                    if optional:
-                        prop.optional = bool(optional)
+                    optional = item_predicates.get(terms.optional, _NO_VALUE)[0]
+                    if optional is not None:
+                        prop.optional = _literal_to_bool(optional)
                     # Check for notInPayload
-                    not_in_payload = self.graph.value(item, self.samm.notInPayload)
-                    if not_in_payload:
-                        prop.not_in_payload = bool(not_in_payload)
+                    not_in_payload = item_predicates.get(terms.notInPayload, _NO_VALUE)[0]
+                    if not_in_payload is not None:
+                        prop.not_in_payload = _literal_to_bool(not_in_payload)
                 else:
                     continue
 
             properties.append(prop)
-            self.model.properties[str(prop.urn)] = prop
+            self.model.properties[prop.urn] = prop
 
         return properties
 
     def _parse_property(self, prop_uri: URIRef) -> Property:
         """Parse a Property element."""
-        prop = Property(urn=str(prop_uri))
+        prop_uri_str = _urn(prop_uri)
+        prop = self._prop_cache.get(prop_uri_str)
+        if prop is not None:
+            return prop
+
+        prop = Property(urn=prop_uri_str)
+        # Cached before its characteristic is parsed, so a StructuredValue
+        # whose elements lead back to this property terminates
+        self._prop_cache[prop_uri_str] = prop
         self._parse_common_attributes(prop_uri, prop)
+        predicates = self._po.get(prop_uri, {})
+        terms = self._samm_terms
 
         # Parse characteristic
-        char_uri = self.graph.value(prop_uri, self.samm.characteristic)
+        char_uri = predicates.get(terms.characteristic, _NO_VALUE)[0]
         if char_uri:
             prop.characteristic = self._parse_characteristic(char_uri)
-            self.model.characteristics[str(char_uri)] = prop.characteristic
+            self.model.characteristics[prop.characteristic.urn] = prop.characteristic
 
         # Parse example value
-        example = self.graph.value(prop_uri, self.samm.exampleValue)
+        example = predicates.get(terms.exampleValue, _NO_VALUE)[0]
         if example:
             prop.example_value = self._literal_to_python(example)
 
         # Parse optional
-        optional = self.graph.value(prop_uri, self.samm.optional)
-        if optional:
-            prop.optional = bool(optional)
+        optional = predicates.get(terms.optional, _NO_VALUE)[0]
+        if optional is not None:
+            prop.optional = _literal_to_bool(optional)
 
         # Parse payloadName
-        payload_name = self.graph.value(prop_uri, self.samm.payloadName)
+        payload_name = predicates.get(terms.payloadName, _NO_VALUE)[0]
         if payload_name:
             prop.payload_name = str(payload_name)
 
         # Parse notInPayload
-        not_in_payload = self.graph.value(prop_uri, self.samm.notInPayload)
-        if not_in_payload:
-            prop.not_in_payload = bool(not_in_payload)
+        not_in_payload = predicates.get(terms.notInPayload, _NO_VALUE)[0]
+        if not_in_payload is not None:
+            prop.not_in_payload = _literal_to_bool(not_in_payload)
 
         return prop
 
     def _parse_characteristic(self, char_uri: URIRef) -> Characteristic:
-        """Parse a Characteristic element."""
+        """Parse a Characteristic element and the characteristics nested in it."""
+        char_uri_str = _urn(char_uri)
+        characteristic = self._char_cache.get(char_uri_str)
+        if characteristic is not None:
+            return characteristic
+        characteristic = self._new_characteristic(char_uri, char_uri_str)
+        if char_uri_str.startswith(self._samm_c_prefix):
+            return characteristic
+
+        c_terms = self._samm_c_terms
+        nested_terms = (
+            # elementCharacteristic (for Collection types), left and right (for Either)
+            ('element_characteristic', c_terms.elementCharacteristic),
+            ('left', c_terms.left),
+            ('right', c_terms.right),
+        )
+
+        # Depth-first worklist instead of recursion; every characteristic is
+        # cached as soon as it is created, so shared and cyclic references
+        # resolve to the same object. Entries with elements_pending set parse
+        # the StructuredValue elements after the nested characteristics.
+        worklist = [(characteristic, char_uri, False)]
+        while worklist:
+            current, current_uri, elements_pending = worklist.pop()
+            predicates = self._po.get(current_uri, {})
+
+            if elements_pending:
+                # Parse elements (for StructuredValue)
+                elements_list = predicates.get(c_terms.elements, _NO_VALUE)[0]
+                if elements_list:
+                    for prop_uri in self._list_items(elements_list):
+                        prop = self._parse_property(prop_uri)
+                        current.elements.append(prop)
+                continue
+
+            worklist.append((current, current_uri, True))
+            nested = []
+            for attribute, term in nested_terms:
+                nested_uri = predicates.get(term, _NO_VALUE)[0]
+                if not nested_uri:
+                    continue
+                nested_uri_str = _urn(nested_uri)
+                nested_char = self._char_cache.get(nested_uri_str)
+                if nested_char is None:
+                    nested_char = self._new_characteristic(nested_uri, nested_uri_str)
+                    if not nested_uri_str.startswith(self._samm_c_prefix):
+                        nested.append((nested_char, nested_uri, False))
+                setattr(current, attribute, nested_char)
+            worklist.extend(reversed(nested))
+
+        return characteristic
+
+    def _new_characteristic(self, char_uri, char_uri_str: str) -> Characteristic:
+        """Create and cache a Characteristic with its own attributes; nested ones are linked by the caller."""
         # Check if this is a predefined characteristic (e.g., samm-c:Boolean)
-        char_uri_str = str(char_uri)
-        if char_uri_str.startswith(str(self.samm_c)):
+        if char_uri_str.startswith(self._samm_c_prefix):
             # This is a predefined characteristic
-            char_type_str = char_uri_str.split('#')[-1]
+            char_type_str = char_uri_str[len(self._samm_c_prefix):]
             characteristic = Characteristic(
                 urn=char_uri_str,
-                characteristic_type=char_type_str
+                characteristic_type=char_type_str,
+                # For predefined characteristics, infer data type
+                data_type=(
+                    self._samm_curie if char_type_str == "UnitReference"
+                    else _PREDEFINED_DATATYPES.get(char_type_str)
+                )
             )
-            # For predefined characteristics, infer data type
-            if char_type_str == "Boolean":
-                characteristic.data_type = str(XSD.boolean)
-            elif char_type_str == "Text":
-                characteristic.data_type = str(XSD.string)
-            elif char_type_str == "Timestamp":
-                characteristic.data_type = str(XSD.dateTime)
+            self._char_cache[char_uri_str] = characteristic
             return characteristic
 
         # Determine characteristic type
-        char_types = list(self.graph.objects(char_uri, RDF.type))
-        char_type_str = "Characteristic"
-
-        for char_type in char_types:
-            if char_type in [self.samm_c.Measurement, self.samm_c.Quantifiable, self.samm_c.Enumeration,
-                            self.samm_c.State, self.samm_c.List, self.samm_c.Set, self.samm_c.SortedSet,
-                            self.samm_c.Collection, self.samm_c.TimeSeries, self.samm_c.Either,
-                            self.samm_c.StructuredValue, self.samm_c.SingleEntity, self.samm_c.Trait,
-                            self.samm_c.Code, self.samm_c.Duration, self.samm_c.Boolean, self.samm_c.Text,
-                            self.samm_c.MultiLanguageText, self.samm_c.Timestamp, self.samm_c.UnitReference]:
-                char_type_str = char_type.split('#')[-1]
-                break
+        char_type_names = self._char_type_names
+        matches = self._types.get(char_uri, set()) & char_type_names.keys()
+        if len(matches) > 1:
+            # Several samm-c types: keep the first one declared in the model
+            matches = [t for t in self._objects(char_uri, RDF.type) if t in matches]
+        char_type_str = char_type_names[next(iter(matches))] if matches else "Characteristic"
 
         characteristic = Characteristic(
-            urn=str(char_uri),
+            urn=char_uri_str,
             characteristic_type=char_type_str
         )
+        self._char_cache[char_uri_str] = characteristic
         self._parse_common_attributes(char_uri, characteristic)
+        predicates = self._po.get(char_uri, {})
+        terms = self._samm_terms
+        c_terms = self._samm_c_terms
 
         # Parse dataType
-        data_type = self.graph.value(char_uri, self.samm.dataType)
+        data_type = predicates.get(terms.dataType, _NO_VALUE)[0]
         if data_type:
-            characteristic.data_type = str(data_type)
+            characteristic.data_type = _urn(data_type)
 
         # Parse unit (for Measurement/Quantifiable)
-        unit = self.graph.value(char_uri, self.samm_c.unit)
+        unit = predicates.get(c_terms.unit, _NO_VALUE)[0]
         if unit:
-            characteristic.unit = str(unit)
+            characteristic.unit = _urn(unit)
 
         # Parse values (for Enumeration/State)
-        values_list = self.graph.value(char_uri, self.samm_c.values)
+        values_list = predicates.get(c_terms.values, _NO_VALUE)[0]
         if values_list:
-            characteristic.values = [
-                self._literal_to_python(v) for v in self.graph.items(values_list)
-            ]
+            characteristic.values = _literal_values(self._list_items(values_list))
 
         # Parse default value (for State)
-        default_value = self.graph.value(char_uri, self.samm_c.defaultValue)
+        default_value = predicates.get(c_terms.defaultValue, _NO_VALUE)[0]
         if default_value:
             characteristic.default_value = self._literal_to_python(default_value)
 
-        # Parse elementCharacteristic (for Collection types)
-        element_char = self.graph.value(char_uri, self.samm_c.elementCharacteristic)
-        if element_char:
-            characteristic.element_characteristic = self._parse_characteristic(element_char)
-
-        # Parse left and right (for Either)
-        left = self.graph.value(char_uri, self.samm_c.left)
-        if left:
-            characteristic.left = self._parse_characteristic(left)
-
-        right = self.graph.value(char_uri, self.samm_c.right)
-        if right:
-            characteristic.right = self._parse_characteristic(right)
-
         # Parse deconstructionRule (for StructuredValue)
-        deconstruction_rule = self.graph.value(char_uri, self.samm_c.deconstructionRule)
+        deconstruction_rule = predicates.get(c_terms.deconstructionRule, _NO_VALUE)[0]
         if deconstruction_rule:
             characteristic.deconstruction_rule = str(deconstruction_rule)
 
-        # Parse elements (for StructuredValue)
-        elements_list = self.graph.value(char_uri, self.samm_c.elements)
-        if elements_list:
-            for prop_uri in self.graph.items(elements_list):
-                prop = self._parse_property(prop_uri)
-                characteristic.elements.append(prop)
-
         return characteristic
 
     def _parse_entity(self, entity_uri: URIRef, is_abstract: bool = False) -> Entity:
         """Parse an Entity element."""
-        entity = Entity(urn=str(entity_uri), is_abstract=is_abstract)
+        entity = Entity(urn=_urn(entity_uri), is_abstract=is_abstract)
         self._parse_common_attributes(entity_uri, entity)
+        predicates = self._po.get(entity_uri, {})
+        terms = self._samm_terms
 
         # Parse properties
-        properties_list = self.graph.value(entity_uri, self.samm.properties)
+        properties_list = predicates.get(terms.properties, _NO_VALUE)[0]
         if properties_list:
             entity.properties = self._parse_property_list(properties_list)
 
         # Parse extends
-        extends = self.graph.value(entity_uri, self.samm.extends)
+        extends = predicates.get(terms.extends, _NO_VALUE)[0]
         if extends:
-            entity.extends = str(extends)
+            entity.extends = _urn(extends)
 
         return entity
 
     def _parse_operation(self, op_uri: URIRef) -> Operation:
         """Parse an Operation element."""
-        operation = Operation(urn=str(op_uri))
+        operation = Operation(urn=_urn(op_uri))
         self._parse_common_attributes(op_uri, operation)
+        predicates = self._po.get(op_uri, {})
+        terms = self._samm_terms
 
         # Parse input
-        input_list = self.graph.value(op_uri, self.samm.input)
+        input_list = predicates.get(terms.input, _NO_VALUE)[0]
         if input_list:
             operation.input_properties = self._parse_property_list(input_list)
 
         # Parse output
-        output_uri = self.graph.value(op_uri, self.samm.output)
+        output_uri = predicates.get(terms.output, _NO_VALUE)[0]
         if output_uri:
             operation.output_property = self._parse_property(output_uri)
 
@@ -366,11 +644,13 @@ class SAMMParser:
 
     def _parse_event(self, event_uri: URIRef) -> Event:
         """Parse an Event element."""
-        event = Event(urn=str(event_uri))
+        event = Event(urn=_urn(event_uri))
         self._parse_common_attributes(event_uri, event)
+        predicates = self._po.get(event_uri, {})
+        terms = self._samm_terms
 
         # Parse parameters
-        params_list = self.graph.value(event_uri, self.samm.parameters)
+        params_list = predicates.get(terms.parameters, _NO_VALUE)[0]
         if params_list:
             event.parameters = self._parse_property_list(params_list)
 
@@ -378,31 +658,29 @@ class SAMMParser:
 
     def _parse_common_attributes(self, uri: URIRef, element: ModelElement):
         """Parse common attributes (preferredName, description, see)."""
+        # The decoded dicts are handed over as they are: each subject is parsed
+        # into one element, and the indexes are dropped after the parse
         # Parse preferredName
-        preferred_names = {}
-        for name in self.graph.objects(uri, self.samm.preferredName):
-            if isinstance(name, Literal):
-                lang = name.language or 'en'
-                preferred_names[lang] = str(name)
+        preferred_names = self._preferred_names.get(uri)
         if preferred_names:
             element.preferred_name = LocalizedString(values=preferred_names)
 
         # Parse description
-        descriptions = {}
-        for desc in self.graph.objects(uri, self.samm.description):
-            if isinstance(desc, Literal):
-                lang = desc.language or 'en'
-                descriptions[lang] = str(desc)
+        descriptions = self._descriptions.get(uri)
         if descriptions:
             element.description = LocalizedString(values=descriptions)
 
         # Parse see
-        for see_uri in self.graph.objects(uri, self.samm.see):
-            element.see.append(str(see_uri))
+        see = self._po.get(uri, {}).get(self._samm_terms.see)
+        if see:
+            element.see = [str(see_uri) for see_uri in see]
 
     def _literal_to_python(self, literal: Literal) -> Any:
         """Convert an RDF Literal to a Python value."""
         if isinstance(literal, Literal):
-            return literal.toPython()
+            # A Literal converts its lexical form once, when it is created;
+            # read that value directly instead of going through toPython()
+            value = literal.value
+            return literal if value is None else value
         else:
             return str(literal)
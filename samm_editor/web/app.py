@@ -2,22 +2,301 @@
 SAMM Web Editor Flask Application
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify
+import gzip
+import hashlib
 import json
-import io
+import threading
 import traceback
+import unicodedata
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
 
 from ..parser import SAMMParser
 from ..writer import SAMMWriter
 from ..json_schema_generator import JSONSchemaGenerator
 from ..json_instance_generator import JSONInstanceGenerator
 from ..model import SAMMModel
+from .._utils import local_name
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    # Flask < 2.2 has no JSON provider API; jsonify keeps the stdlib encoder
+    DefaultJSONProvider = None
+
+
+if orjson is not None and DefaultJSONProvider is not None:
+    class _OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that renders jsonify responses with orjson.
+
+        Keys stay sorted like the default provider; dates, decimals and other
+        non-native values still go through the default provider's conversion.
+        """
+
+        def response(self, *args, **kwargs):
+            if args and kwargs:
+                raise TypeError("app.json.response() takes either args or kwargs, not both")
+            obj = (args[0] if len(args) == 1 else args) if args else (kwargs or None)
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if (self.compact is None and self._app.debug) or self.compact is False:
+                option |= orjson.OPT_INDENT_2
+            try:
+                body = orjson.dumps(obj, default=self.default, option=option)
+            except TypeError:
+                # e.g. integers beyond 64 bit; let the stdlib encoder handle them
+                return super().response(obj)
+            return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+else:
+    _OrjsonProvider = None
 
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+if _OrjsonProvider is not None:
+    app.json = _OrjsonProvider(app)
+
+# Number of parsed models kept in memory
+MODEL_CACHE_SIZE = 64
+# Larger Turtle documents are parsed per request instead of being cached
+MODEL_CACHE_MAX_CONTENT_LENGTH = 1024 * 1024
+# Characters encoded per chunk of a /api/download response
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Responses of these types are gzip-compressed from this size (bytes) on
+COMPRESS_MIMETYPES = frozenset(('application/json', 'text/html', 'text/plain'))
+COMPRESS_MIN_SIZE = 1024
+
+
+class _ModelEntry:
+    """A parsed model with its JSON Schema and instance, generated on first use."""
+
+    __slots__ = ('model', '_info', '_validation', '_schema', '_instance')
+
+    def __init__(self, model: SAMMModel):
+        self.model = model
+        self._info = None
+        self._validation = None
+        self._schema = None
+        self._instance = None
+
+    @property
+    def info(self):
+        if self._info is None:
+            self._info = _model_info(self.model)
+        return self._info
+
+    @property
+    def validation(self):
+        if self._validation is None:
+            self._validation = _model_validation(self.model)
+        return self._validation
+
+    @property
+    def schema(self):
+        if self._schema is None:
+            self._schema = JSONSchemaGenerator(self.model).generate()
+        return self._schema
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._instance = JSONInstanceGenerator(self.model).generate()
+        return self._instance
+
+
+def _characteristic_ref(characteristic) -> Tuple[Optional[str], str]:
+    """Return the id and type name /api/parse reports for a property's characteristic."""
+    if characteristic is None:
+        return None, 'Text'
+    if isinstance(characteristic, str):
+        # A URN string (backward compatibility); the type is unknown
+        return local_name(characteristic), 'Text'
+    return characteristic.local_name, characteristic.characteristic_type
+
+
+def _model_info(model: SAMMModel) -> Dict[str, Any]:
+    """Build the model summary returned by /api/parse."""
+    info = {
+        'namespace': model.namespace,
+        'aspect': None,
+        'entities': [],
+        'properties': [],
+        'characteristics': []
+    }
+
+    aspect = model.aspect
+    if aspect:
+        info['aspect'] = {
+            'urn': aspect.urn,
+            'name': aspect.preferred_name.values.get('en', '') if aspect.preferred_name else '',
+            'description': aspect.description.values.get('en', '') if aspect.description else '',
+            # Property IDs of the aspect's Property objects
+            'properties': [p.local_name for p in aspect.properties],
+            'properties_count': len(aspect.properties),
+            'operations_count': len(aspect.operations),
+            'events_count': len(aspect.events)
+        }
+
+    info['entities'].extend(
+        {
+            'urn': entity_urn,
+            'id': entity.local_name,
+            'preferredName': entity.preferred_name.values if entity.preferred_name else {'en': ''},
+            'description': entity.description.values if entity.description else {'en': ''},
+            'isAbstract': entity.is_abstract,
+            'properties': [p.local_name for p in entity.properties]
+        }
+        for entity_urn, entity in model.entities.items()
+    )
+
+    for prop_urn, prop in model.properties.items():
+        char_id, char_type = _characteristic_ref(prop.characteristic)
+        info['properties'].append({
+            'urn': prop_urn,
+            'id': prop.local_name,
+            'preferredName': prop.preferred_name.values if prop.preferred_name else {'en': ''},
+            'description': prop.description.values if prop.description else {'en': ''},
+            'optional': prop.optional,
+            'characteristic': char_id,  # Reference to characteristic ID
+            'characteristicType': char_type,  # Type of the characteristic
+        })
+
+    for char_urn, char in model.characteristics.items():
+        char_info = {
+            'urn': char_urn,
+            'id': char.local_name,
+            'preferredName': char.preferred_name.values if char.preferred_name else {'en': ''},
+            'description': char.description.values if char.description else {'en': ''},
+            'characteristicType': char.characteristic_type,
+            'dataType': char.data_type
+        }
+        # Add type-specific fields
+        if char.unit:
+            char_info['unit'] = char.unit
+        if char.values:
+            char_info['values'] = char.values
+        if char.element_characteristic:
+            char_info['elementCharacteristic'] = char.element_characteristic
+        info['characteristics'].append(char_info)
+
+    return info
+
+
+def _model_validation(model: SAMMModel) -> Dict[str, Any]:
+    """Run the basic checks returned by /api/validate."""
+    errors = []
+    warnings = []
+
+    if not model.aspect:
+        errors.append("No Aspect found in the model")
+
+    if model.aspect:
+        if not model.aspect.preferred_name or 'en' not in model.aspect.preferred_name.values:
+            warnings.append("Aspect should have preferredName with 'en' language tag")
+
+        if not model.aspect.description or 'en' not in model.aspect.description.values:
+            warnings.append("Aspect should have description with 'en' language tag")
+
+        if len(model.aspect.properties) == 0:
+            warnings.append("Aspect has no properties")
+
+    return {
+        'valid': len(errors) == 0,
+        'errors': errors,
+        'warnings': warnings
+    }
+
+
+# LRU of content digest -> _ModelEntry, so repeated requests for the same
+# Turtle content skip parsing and generation. Entries are shared between
+# requests: route handlers only read the model, schema and instance.
+_model_cache = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def _get_model_entry(turtle_content: str) -> _ModelEntry:
+    """Return the cached entry for the Turtle content, parsing it on a miss."""
+    if len(turtle_content) > MODEL_CACHE_MAX_CONTENT_LENGTH:
+        return _ModelEntry(SAMMParser().parse_string(turtle_content))
+
+    key = hashlib.blake2b(turtle_content.encode('utf-8'), digest_size=16).digest()
+
+    with _model_cache_lock:
+        entry = _model_cache.get(key)
+        if entry is not None:
+            _model_cache.move_to_end(key)
+            return entry
+
+    # Parse outside the lock; a parse error is raised and nothing is cached
+    parser = SAMMParser()
+    entry = _ModelEntry(parser.parse_string(turtle_content))
+
+    with _model_cache_lock:
+        _model_cache[key] = entry
+        if len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    return entry
+
+
+def _load_examples() -> Dict[str, str]:
+    """Read the bundled example models and warm the model cache with them."""
+    examples_dir = Path(__file__).parent.parent.parent / 'examples'
+    examples = {path.stem: path.read_text(encoding='utf-8') for path in sorted(examples_dir.glob('*.ttl'))}
+    for turtle_content in examples.values():
+        try:
+            _get_model_entry(turtle_content)
+        except Exception:
+            # A broken example is reported when it is parsed from the editor
+            pass
+    return examples
+
+
+# Example name -> Turtle content, read once at startup
+_EXAMPLES = _load_examples()
+
+
+@app.after_request
+def _compress_response(response):
+    """Gzip larger text and JSON responses for clients that accept it."""
+    if (response.direct_passthrough
+            or response.is_streamed
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    # The body depends on Accept-Encoding from here on, gzipped or not, so
+    # shared caches must not hand one client's variant to another
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.accept_encodings:
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def _error_response(error: Exception):
+    """Build the 400 response for a failed model request.
+
+    The traceback is logged, and only sent to the client in debug mode.
+    """
+    app.logger.exception('Request failed: %s', error)
+    return jsonify({
+        'success': False,
+        'error': str(error),
+        'traceback': traceback.format_exc() if app.debug else None
+    }), 400
 
 
 @app.route('/')
@@ -36,101 +315,20 @@ def parse_turtle():
         if not turtle_content.strip():
             return jsonify({'error': 'Empty Turtle content'}), 400
 
-        # Parse the Turtle content
-        parser = SAMMParser()
-        model = parser.parse_string(turtle_content)
-
-        # Extract model information
-        info = {
-            'namespace': model.namespace,
-            'aspect': None,
-            'entities': [],
-            'properties': [],
-            'characteristics': []
+        # Parse the Turtle content and extract model information
+        entry = _get_model_entry(turtle_content)
+        result = {
+            'success': True,
+            'info': entry.info
         }
+        # ?validate=1 also returns the /api/validate result, saving a request
+        if request.args.get('validate') == '1':
+            result['validation'] = entry.validation
 
-        if model.aspect:
-            # Extract property IDs from Property objects
-            prop_ids = [p.urn.split('#')[1] if '#' in p.urn else p.urn for p in model.aspect.properties]
-
-            info['aspect'] = {
-                'urn': model.aspect.urn,
-                'name': model.aspect.preferred_name.values.get('en', '') if model.aspect.preferred_name else '',
-                'description': model.aspect.description.values.get('en', '') if model.aspect.description else '',
-                'properties': prop_ids,
-                'properties_count': len(model.aspect.properties),
-                'operations_count': len(model.aspect.operations),
-                'events_count': len(model.aspect.events)
-            }
-
-        for entity_urn, entity in model.entities.items():
-            # Extract property IDs from Property objects
-            entity_prop_ids = [p.urn.split('#')[1] if '#' in p.urn else p.urn for p in entity.properties]
-
-            entity_info = {
-                'urn': entity_urn,
-                'id': entity_urn.split('#')[1] if '#' in entity_urn else entity_urn,
-                'preferredName': entity.preferred_name.values if entity.preferred_name else {'en': ''},
-                'description': entity.description.values if entity.description else {'en': ''},
-                'isAbstract': entity.is_abstract,
-                'properties': entity_prop_ids
-            }
-            info['entities'].append(entity_info)
-
-        for prop_urn, prop in model.properties.items():
-            prop_info = {
-                'urn': prop_urn,
-                'id': prop_urn.split('#')[1] if '#' in prop_urn else prop_urn,
-                'preferredName': prop.preferred_name.values if prop.preferred_name else {'en': ''},
-                'description': prop.description.values if prop.description else {'en': ''},
-                'optional': prop.optional,
-                'characteristic': None,  # Reference to characteristic ID
-                'characteristicType': 'Text',  # Type of the characteristic
-            }
-            if prop.characteristic:
-                # prop.characteristic is a Characteristic object
-                if isinstance(prop.characteristic, str):
-                    # If it's a URN string (backward compatibility)
-                    char_id = prop.characteristic.split('#')[-1] if '#' in prop.characteristic else prop.characteristic
-                    prop_info['characteristic'] = char_id
-                    prop_info['characteristicType'] = 'Text'  # Unknown type
-                else:
-                    # It's a Characteristic object
-                    char_id = prop.characteristic.urn.split('#')[-1] if '#' in prop.characteristic.urn else str(prop.characteristic.urn)
-                    char_type = prop.characteristic.characteristic_type if hasattr(prop.characteristic, 'characteristic_type') else 'Text'
-                    prop_info['characteristic'] = char_id
-                    prop_info['characteristicType'] = char_type
-            info['properties'].append(prop_info)
-
-        for char_urn, char in model.characteristics.items():
-            char_info = {
-                'urn': char_urn,
-                'id': char_urn.split('#')[1] if '#' in char_urn else char_urn,
-                'preferredName': char.preferred_name.values if char.preferred_name else {'en': ''},
-                'description': char.description.values if char.description else {'en': ''},
-                'characteristicType': char.characteristic_type if hasattr(char, 'characteristic_type') else 'Text',
-                'dataType': char.data_type if hasattr(char, 'data_type') else ''
-            }
-            # Add type-specific fields
-            if hasattr(char, 'unit') and char.unit:
-                char_info['unit'] = char.unit
-            if hasattr(char, 'values') and char.values:
-                char_info['values'] = char.values
-            if hasattr(char, 'element_characteristic') and char.element_characteristic:
-                char_info['elementCharacteristic'] = char.element_characteristic
-            info['characteristics'].append(char_info)
-
-        return jsonify({
-            'success': True,
-            'info': info
-        })
+        return jsonify(result)
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 400
+        return _error_response(e)
 
 
 @app.route('/api/generate-schema', methods=['POST'])
@@ -144,11 +342,7 @@ def generate_schema():
             return jsonify({'error': 'Empty Turtle content'}), 400
 
         # Parse and generate schema
-        parser = SAMMParser()
-        model = parser.parse_string(turtle_content)
-
-        generator = JSONSchemaGenerator(model)
-        schema = generator.generate()
+        schema = _get_model_entry(turtle_content).schema
 
         return jsonify({
             'success': True,
@@ -156,11 +350,7 @@ def generate_schema():
         })
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 400
+        return _error_response(e)
 
 
 @app.route('/api/generate-instance', methods=['POST'])
@@ -174,11 +364,7 @@ def generate_instance():
             return jsonify({'error': 'Empty Turtle content'}), 400
 
         # Parse and generate instance
-        parser = SAMMParser()
-        model = parser.parse_string(turtle_content)
-
-        generator = JSONInstanceGenerator(model)
-        instance = generator.generate()
+        instance = _get_model_entry(turtle_content).instance
 
         return jsonify({
             'success': True,
@@ -186,11 +372,7 @@ def generate_instance():
         })
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 400
+        return _error_response(e)
 
 
 @app.route('/api/validate', methods=['POST'])
@@ -203,40 +385,16 @@ def validate_model():
         if not turtle_content.strip():
             return jsonify({'error': 'Empty Turtle content'}), 400
 
-        # Parse the model
-        parser = SAMMParser()
-        model = parser.parse_string(turtle_content)
-
-        # Basic validation
-        errors = []
-        warnings = []
-
-        if not model.aspect:
-            errors.append("No Aspect found in the model")
-
-        if model.aspect:
-            if not model.aspect.preferred_name or 'en' not in model.aspect.preferred_name.values:
-                warnings.append("Aspect should have preferredName with 'en' language tag")
-
-            if not model.aspect.description or 'en' not in model.aspect.description.values:
-                warnings.append("Aspect should have description with 'en' language tag")
-
-            if len(model.aspect.properties) == 0:
-                warnings.append("Aspect has no properties")
+        # Parse (or reuse the cached model) and validate it
+        validation = _get_model_entry(turtle_content).validation
 
         return jsonify({
             'success': True,
-            'valid': len(errors) == 0,
-            'errors': errors,
-            'warnings': warnings
+            **validation
         })
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 400
+        return _error_response(e)
 
 
 @app.route('/api/load-example/<example_name>')
@@ -247,15 +405,10 @@ def load_example(example_name):
         if '..' in example_name or '/' in example_name:
             return jsonify({'error': 'Invalid example name'}), 400
 
-        # Get the project root directory
-        project_root = Path(__file__).parent.parent.parent
-        example_path = project_root / 'examples' / f'{example_name}.ttl'
-
-        if not example_path.exists():
+        turtle_content = _EXAMPLES.get(example_name)
+        if turtle_content is None:
             return jsonify({'error': 'Example not found'}), 404
 
-        turtle_content = example_path.read_text(encoding='utf-8')
-
         return jsonify({
             'success': True,
             'turtle': turtle_content,
@@ -278,16 +431,22 @@ def download_file():
         filename = data.get('filename', 'download.txt')
         content_type = data.get('content_type', 'text/plain')
 
-        # Create a BytesIO object
-        file_stream = io.BytesIO(content.encode('utf-8'))
-        file_stream.seek(0)
-
-        return send_file(
-            file_stream,
-            mimetype=content_type,
-            as_attachment=True,
-            download_name=filename
-        )
+        # Encode and send the content in chunks rather than as one buffer
+        def generate():
+            for start in range(0, len(content), DOWNLOAD_CHUNK_SIZE):
+                yield content[start:start + DOWNLOAD_CHUNK_SIZE].encode('utf-8')
+
+        response = Response(generate(), mimetype=content_type)
+        try:
+            filename.encode('ascii')
+        except UnicodeEncodeError:
+            # Same ASCII fallback plus RFC 5987 name that send_file uses
+            simple = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+            names = {'filename': simple, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+-.^_`|~')}"}
+        else:
+            names = {'filename': filename}
+        response.headers.set('Content-Disposition', 'attachment', **names)
+        return response
 
     except Exception as e:
         return jsonify({
@@ -4,13 +4,17 @@ SAMM Turtle Writer
 Converts SAMMModel objects back to Turtle format for saving.
 """
 
-from rdflib import Graph, Namespace, RDF, Literal, URIRef, BNode
+import io
+import re
+from functools import lru_cache
+from types import SimpleNamespace
+
+from rdflib import Namespace, RDF, Literal, URIRef, BNode
 from rdflib.namespace import XSD
-from rdflib.collection import Collection
-from typing import Optional, List
+from rdflib.term import Node
+from typing import Callable, Dict, Iterable, Optional, List, Set, TextIO, Tuple
 from .model import (
-    SAMMModel, Aspect, Property, Characteristic, Entity, Operation, Event,
-    LocalizedString, ModelElement
+    SAMMModel, Aspect, Property, Characteristic, Entity, Operation, Event, ModelElement
 )
 
 
@@ -20,45 +24,244 @@ SAMM_C = Namespace("urn:samm:org.eclipse.esmf.samm:characteristic:2.2.0#")
 SAMM_E = Namespace("urn:samm:org.eclipse.esmf.samm:entity:2.2.0#")
 UNIT = Namespace("urn:samm:org.eclipse.esmf.samm:unit:2.2.0#")
 
+# Terms written by the writer, built once so lookups skip Namespace.__getattr__
+_S = SimpleNamespace(**{name: SAMM[name] for name in (
+    "Aspect", "Entity", "AbstractEntity", "Property", "Characteristic", "Operation", "Event",
+    "properties", "operations", "events", "property", "payloadName", "optional", "notInPayload",
+    "characteristic", "exampleValue", "dataType", "extends", "input", "output", "parameters",
+    "preferredName", "description", "see",
+)})
+_SC = SimpleNamespace(**{name: SAMM_C[name] for name in (
+    "unit", "values", "defaultValue", "elementCharacteristic", "left", "right",
+    "deconstructionRule", "elements",
+)})
+_TYPE = RDF.type
+_FIRST = RDF.first
+_REST = RDF.rest
+_NIL = RDF.nil
+
+# Prefixes the writer always binds to the namespaces above
+_STANDARD_PREFIXES = frozenset(('samm', 'samm-c', 'samm-e', 'unit', 'xsd'))
+
+# RDF type written for each characteristic_type
+_CHAR_TYPE_MAP = {
+    "Measurement": SAMM_C.Measurement,
+    "Quantifiable": SAMM_C.Quantifiable,
+    "Enumeration": SAMM_C.Enumeration,
+    "State": SAMM_C.State,
+    "Collection": SAMM_C.Collection,
+    "List": SAMM_C.List,
+    "Set": SAMM_C.Set,
+    "SortedSet": SAMM_C.SortedSet,
+    "TimeSeries": SAMM_C.TimeSeries,
+    "Either": SAMM_C.Either,
+    "StructuredValue": SAMM_C.StructuredValue,
+    "SingleEntity": SAMM_C.SingleEntity,
+    "Trait": SAMM_C.Trait,
+    "Code": SAMM_C.Code,
+    "Duration": SAMM_C.Duration,
+    "Boolean": SAMM_C.Boolean,
+    "Text": SAMM_C.Text,
+    "MultiLanguageText": SAMM_C.MultiLanguageText,
+    "Timestamp": SAMM_C.Timestamp,
+    "UnitReference": SAMM_C.UnitReference,
+}
+
+# xsd:boolean literals, shared by every flag and boolean value written
+_TRUE = Literal(True, datatype=XSD.boolean)
+_FALSE = Literal(False, datatype=XSD.boolean)
+
+
+def _bool_literal(value: bool) -> Literal:
+    """Return the shared xsd:boolean literal for a bool."""
+    return _TRUE if value else _FALSE
+
+
+def _integer_literal(value: int) -> Literal:
+    """Convert an int to an xsd:integer literal."""
+    return Literal(value, datatype=XSD.integer)
+
+
+def _float_literal(value: float) -> Literal:
+    """Convert a float to an xsd:float literal."""
+    return Literal(value, datatype=XSD.float)
+
+
+# Literal converters keyed by concrete type; other values are written as plain strings
+_LITERAL_CONVERTERS = {
+    bool: _bool_literal,
+    int: _integer_literal,
+    float: _float_literal,
+    str: Literal,
+}
+
+
+# Local names that can be written after a prefix without escaping
+_PN_LOCAL = re.compile(r'[A-Za-z0-9_](?:[A-Za-z0-9_.\-]*[A-Za-z0-9_\-])?\Z')
+
+# Turtle shorthand for booleans and integers, written without quotes
+_BARE_DATATYPES = frozenset((XSD.boolean, XSD.integer))
+
+_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+# Characters not allowed in an IRIREF, written as \u escapes
+_IRI_ESCAPES = {code: f"\\u{code:04X}" for code in (*range(0x21), *map(ord, '<>"{}|^`\\'))}
+
+
+def _iri_ref(uri: str) -> str:
+    """Return an IRI as an <IRIREF>, escaping the characters it may not contain."""
+    return f"<{uri.translate(_IRI_ESCAPES)}>"
+
+
+def _nt_term(node: Node) -> str:
+    """Return the N-Triples text of a term."""
+    if isinstance(node, URIRef):
+        return _iri_ref(node)
+    if isinstance(node, Literal):
+        # Literal.n3() may use Turtle's long-string form, which N-Triples lacks
+        quoted = f'"{str(node).translate(_STRING_ESCAPES)}"'
+        if node.language:
+            return f"{quoted}@{node.language}"
+        if node.datatype is not None and node.datatype != XSD.string:
+            return f"{quoted}^^{_iri_ref(node.datatype)}"
+        return quoted
+    return node.n3()
+
+
+class TurtleTextWriter:
+    """Writes Turtle text one subject block at a time."""
+
+    def __init__(self, stream: TextIO):
+        self._write = stream.write
+        self._started = False
+        self._in_subject = False
+
+    def emit_prefix(self, prefix: str, uri: str):
+        """Write a @prefix declaration."""
+        self._write(f"@prefix {prefix}: {_iri_ref(uri)} .\n")
+        self._started = True
+
+    def emit_subject(self, subject: str):
+        """Start the block of a subject."""
+        self._write(f"\n{subject}" if self._started else subject)
+        self._started = True
+        self._in_subject = False
+
+    def emit_po(self, predicate: str, obj: str):
+        """Write a predicate-object pair of the current subject."""
+        self._write(f" ;\n    {predicate} {obj}" if self._in_subject else f" {predicate} {obj}")
+        self._in_subject = True
+
+    def end_subject(self):
+        """Close the block of the current subject."""
+        self._write(" .\n")
+
 
 class SAMMWriter:
     """Writer for SAMM Turtle files."""
 
+    __slots__ = ('model', '_triples', '_add', '_uri', '_written_chars', '_written_props',
+                 '_written_ops', '_written_events', '_prefixes', '_namespaces', '_qnames')
+
     def __init__(self, model: SAMMModel):
-        self.model = model
-        self.graph = Graph()
+        # One URIRef per URN, shared by every triple that mentions it
+        self._init_state(model, lru_cache(maxsize=None)(URIRef))
         self._bind_namespaces()
 
+    def _init_state(self, model: SAMMModel, uri: Callable[[str], URIRef]):
+        """Set up the per-model state, using uri to build URIRefs."""
+        self.model = model
+        # Triples collected by the _write_* methods; the Turtle and N-Triples
+        # output is written straight from this buffer
+        self._triples: List[Tuple[Node, Node, Node]] = []
+        self._add = self._triples.append
+        self._uri = uri
+        # URNs of the elements already in the graph; a shared element is
+        # written once, however often it is referenced
+        self._written_chars: Set[str] = set()
+        self._written_props: Set[str] = set()
+        self._written_ops: Set[str] = set()
+        self._written_events: Set[str] = set()
+        # namespace URI -> prefix, filled by _bind_namespaces
+        self._prefixes: Dict[str, str] = {}
+        # Namespaces longest first, for IRIs that do not end in '#' or '/' + local name
+        self._namespaces: List[str] = []
+        # IRI -> (Turtle text, prefix used), computed once per IRI
+        self._qnames: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    @classmethod
+    def write_many(cls, models: Iterable[SAMMModel], file_paths: Iterable[str],
+                   streaming: bool = False):
+        """Write each model to the matching file path.
+
+        The writers share one URIRef cache, and models with the same prefixes
+        and local namespace share their namespace binding and qname cache.
+        """
+        uri = lru_cache(maxsize=None)(URIRef)
+        bindings: Dict[tuple, tuple] = {}
+        for model, file_path in zip(models, file_paths):
+            writer = cls.__new__(cls)
+            writer._init_state(model, uri)
+            key = (model.namespace, tuple(sorted(model.prefixes.items())))
+            binding = bindings.get(key)
+            if binding is None:
+                writer._bind_namespaces()
+                bindings[key] = (writer._prefixes, writer._namespaces, writer._qnames)
+            else:
+                writer._prefixes, writer._namespaces, writer._qnames = binding
+            writer.write_to_file(file_path, streaming=streaming)
+
     def _bind_namespaces(self):
-        """Bind standard and custom namespaces to the graph."""
-        # Bind standard SAMM namespaces
-        self.graph.bind('samm', SAMM)
-        self.graph.bind('samm-c', SAMM_C)
-        self.graph.bind('samm-e', SAMM_E)
-        self.graph.bind('unit', UNIT)
-        self.graph.bind('xsd', XSD)
+        """Bind standard and custom namespaces to prefixes."""
+        prefixes = self._prefixes
 
-        # Bind custom namespaces from model
+        # Bind custom namespaces from model; the standard SAMM prefixes and the
+        # local namespace below take precedence
         for prefix, namespace in self.model.prefixes.items():
-            if prefix and prefix not in ['samm', 'samm-c', 'samm-e', 'unit', 'xsd']:
-                self.graph.bind(prefix, Namespace(namespace))
+            if prefix and prefix not in _STANDARD_PREFIXES:
+                prefixes[namespace] = prefix
+
+        # Bind standard SAMM namespaces
+        prefixes[str(SAMM)] = 'samm'
+        prefixes[str(SAMM_C)] = 'samm-c'
+        prefixes[str(SAMM_E)] = 'samm-e'
+        prefixes[str(UNIT)] = 'unit'
+        prefixes[str(XSD)] = 'xsd'
 
         # Bind local namespace
         if self.model.namespace:
-            self.graph.bind('', Namespace(self.model.namespace))
+            prefixes[self.model.namespace] = ''
+
+        self._namespaces = sorted(prefixes, key=len, reverse=True)
 
-    def write_to_file(self, file_path: str):
-        """Write the model to a Turtle file."""
-        self._build_graph()
-        self.graph.serialize(destination=file_path, format='turtle')
+    def write_to_file(self, file_path: str, streaming: bool = False):
+        """Write the model to a Turtle file.
+
+        With streaming=True the triples are written line by line as N-Triples,
+        which is valid Turtle, skipping the subject grouping. Use it for very
+        large models; the output has no prefix declarations.
+        """
+        self._build_triples()
+        with open(file_path, 'w', encoding='utf-8') as f:
+            if streaming:
+                self._write_ntriples(f)
+            else:
+                self._write_turtle(f)
 
     def write_to_string(self) -> str:
         """Write the model to a Turtle string."""
-        self._build_graph()
-        return self.graph.serialize(format='turtle')
+        self._build_triples()
+        out = io.StringIO()
+        self._write_turtle(out)
+        return out.getvalue()
+
+    def _build_triples(self):
+        """Collect the triples of the SAMMModel in the triple buffer."""
+        self._triples.clear()
+        for written in (self._written_chars, self._written_props,
+                        self._written_ops, self._written_events):
+            written.clear()
 
-    def _build_graph(self):
-        """Build the RDF graph from the SAMMModel."""
         # Write Aspect
         if self.model.aspect:
             self._write_aspect(self.model.aspect)
@@ -71,258 +274,452 @@ class SAMMWriter:
         for characteristic in self.model.characteristics.values():
             self._write_characteristic(characteristic)
 
-        # Write standalone Properties
+        # Write standalone Properties (those of the Aspect/Entities are already written)
         for prop in self.model.properties.values():
-            # Only write if not already part of Aspect/Entity
-            if not self._is_part_of_aspect_or_entity(prop):
-                self._write_property(prop)
+            self._write_property(prop)
 
         # Write Operations
         for operation in self.model.operations.values():
-            # Only write if not already part of Aspect
-            if not self._is_operation_in_aspect(operation):
-                self._write_operation(operation)
+            self._write_operation(operation)
 
         # Write Events
         for event in self.model.events.values():
-            # Only write if not already part of Aspect
-            if not self._is_event_in_aspect(event):
-                self._write_event(event)
-
-    def _is_part_of_aspect_or_entity(self, prop: Property) -> bool:
-        """Check if property is already part of Aspect or Entity."""
-        if self.model.aspect:
-            if any(p.urn == prop.urn for p in self.model.aspect.properties):
-                return True
-        for entity in self.model.entities.values():
-            if any(p.urn == prop.urn for p in entity.properties):
-                return True
-        return False
-
-    def _is_operation_in_aspect(self, operation: Operation) -> bool:
-        """Check if operation is already part of Aspect."""
-        if self.model.aspect:
-            return any(op.urn == operation.urn for op in self.model.aspect.operations)
-        return False
-
-    def _is_event_in_aspect(self, event: Event) -> bool:
-        """Check if event is already part of Aspect."""
-        if self.model.aspect:
-            return any(e.urn == event.urn for e in self.model.aspect.events)
-        return False
+            self._write_event(event)
+
+    def _write_ntriples(self, stream: TextIO):
+        """Write the triple buffer as N-Triples."""
+        write = stream.write
+        for s, p, o in self._triples:
+            write(f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n")
+
+    def _write_turtle(self, stream: TextIO):
+        """Write the triple buffer as Turtle, one block per subject.
+
+        A blank node referenced once is written inline: as ( ... ) when it
+        heads a well-formed RDF list, as [ ... ] otherwise. Other blank nodes
+        get a _: label and a block of their own.
+        """
+        blocks: Dict[Node, List[Tuple[Node, Node]]] = {}
+        references: Dict[BNode, int] = {}
+        for s, p, o in self._triples:
+            pos = blocks.get(s)
+            if pos is None:
+                blocks[s] = pos = []
+            pos.append((p, o))
+            if isinstance(o, BNode):
+                references[o] = references.get(o, 0) + 1
+
+        used: Set[str] = set()
+        qnames = self._qnames
+        qname = self._qname
+        # Blank nodes already written, inline or as a labelled block
+        written: Set[BNode] = set()
+
+        def iri(uri: URIRef) -> str:
+            entry = qnames.get(uri)
+            if entry is None:
+                qnames[uri] = entry = qname(uri)
+            text, prefix = entry
+            if prefix is not None:
+                used.add(prefix)
+            return text
+
+        def predicate(p: Node) -> str:
+            return 'a' if p == _TYPE else iri(p)
+
+        def inlinable(node: Node) -> bool:
+            return isinstance(node, BNode) and references.get(node) == 1 and node not in written
+
+        def list_items(node: BNode) -> Optional[List[Node]]:
+            """Items of the RDF list headed by node, or None if it is not a plain list."""
+            items = []
+            seen = set()
+            while node != _NIL:
+                if not inlinable(node) or node in seen:
+                    return None
+                pos = blocks.get(node, ())
+                if len(pos) != 2:
+                    return None
+                values = dict(pos)
+                if len(values) != 2 or _FIRST not in values or _REST not in values:
+                    return None
+                seen.add(node)
+                items.append(values[_FIRST])
+                node = values[_REST]
+            written.update(seen)
+            return items
+
+        def term(node: Node) -> str:
+            if isinstance(node, Literal):
+                return self._literal_text(node, iri)
+            if isinstance(node, BNode):
+                if not inlinable(node):
+                    return f"_:{node}"
+                items = list_items(node)
+                if items is not None:
+                    return f"( {' '.join(term(item) for item in items)} )"
+                written.add(node)
+                pos = blocks.get(node, ())
+                if not pos:
+                    return '[]'
+                return f"[ {' ; '.join(f'{predicate(p)} {term(o)}' for p, o in pos)} ]"
+            if node == _NIL:
+                return '()'
+            return iri(node)
+
+        body = io.StringIO()
+        w = TurtleTextWriter(body)
+
+        def write_block(subject: Node, pos: List[Tuple[Node, Node]]):
+            w.emit_subject(iri(subject) if isinstance(subject, URIRef) else f"_:{subject}")
+            for p, o in pos:
+                w.emit_po(predicate(p), term(o))
+            w.end_subject()
+
+        for subject, pos in blocks.items():
+            if not isinstance(subject, BNode):
+                write_block(subject, pos)
+        # Blank nodes that could not be written inline
+        for subject, pos in blocks.items():
+            if isinstance(subject, BNode) and subject not in written:
+                written.add(subject)
+                write_block(subject, pos)
+
+        out = TurtleTextWriter(stream)
+        prefixes = {prefix: namespace for namespace, prefix in self._prefixes.items()}
+        for prefix in sorted(used):
+            out.emit_prefix(prefix, prefixes[prefix])
+        if used:
+            stream.write("\n")
+        stream.write(body.getvalue())
+
+    def _qname(self, uri: str) -> Tuple[str, Optional[str]]:
+        """Return the Turtle text of an IRI and the prefix it uses, if any."""
+        prefixes = self._prefixes
+        cut = max(uri.rfind('#'), uri.rfind('/')) + 1
+        namespace = uri[:cut]
+        prefix = prefixes.get(namespace)
+        if prefix is None:
+            namespace = next((ns for ns in self._namespaces if uri.startswith(ns)), None)
+            prefix = prefixes.get(namespace)
+        if prefix is not None:
+            local = uri[len(namespace):]
+            if _PN_LOCAL.match(local):
+                return f"{prefix}:{local}", prefix
+        return _iri_ref(uri), None
+
+    @staticmethod
+    def _literal_text(literal: Literal, iri: Callable[[URIRef], str]) -> str:
+        """Return the Turtle text of a literal."""
+        datatype = literal.datatype
+        if datatype in _BARE_DATATYPES:
+            return str(literal)
+        quoted = f'"{str(literal).translate(_STRING_ESCAPES)}"'
+        if literal.language:
+            return f"{quoted}@{literal.language}"
+        if datatype is not None and datatype != XSD.string:
+            return f"{quoted}^^{iri(datatype)}"
+        return quoted
 
     def _write_aspect(self, aspect: Aspect):
         """Write an Aspect to the graph."""
-        aspect_uri = URIRef(aspect.urn)
-        self.graph.add((aspect_uri, RDF.type, SAMM.Aspect))
+        add = self._add
+        uri = self._uri
+        aspect_uri = uri(aspect.urn)
+        add((aspect_uri, _TYPE, _S.Aspect))
         self._write_common_attributes(aspect_uri, aspect)
 
         # Write properties list
         if aspect.properties:
             props_list = self._create_property_list(aspect.properties)
-            self.graph.add((aspect_uri, SAMM.properties, props_list))
+            add((aspect_uri, _S.properties, props_list))
 
         # Write operations list
-        if aspect.operations:
-            ops_list = BNode()
-            Collection(self.graph, ops_list, [URIRef(op.urn) for op in aspect.operations])
-            self.graph.add((aspect_uri, SAMM.operations, ops_list))
-            for operation in aspect.operations:
-                self._write_operation(operation)
+        operations = aspect.operations
+        if operations:
+            ops_list = self._create_list([uri(op.urn) for op in operations])
+            add((aspect_uri, _S.operations, ops_list))
+            write_operation = self._write_operation
+            for operation in operations:
+                write_operation(operation)
 
         # Write events list
-        if aspect.events:
-            events_list = BNode()
-            Collection(self.graph, events_list, [URIRef(e.urn) for e in aspect.events])
-            self.graph.add((aspect_uri, SAMM.events, events_list))
-            for event in aspect.events:
-                self._write_event(event)
-
-    def _create_property_list(self, properties: List[Property]) -> BNode:
+        events = aspect.events
+        if events:
+            events_list = self._create_list([uri(e.urn) for e in events])
+            add((aspect_uri, _S.events, events_list))
+            write_event = self._write_event
+            for event in events:
+                write_event(event)
+
+    def _create_property_list(self, properties: List[Property]) -> Node:
         """Create an RDF Collection for a list of properties."""
+        add = self._add
+        uri = self._uri
+        write_property = self._write_property
         prop_nodes = []
+        append = prop_nodes.append
         for prop in properties:
-            self._write_property(prop)
+            write_property(prop)
 
             # Check if we need a wrapper node for payloadName or optional
-            if prop.payload_name or prop.optional or prop.not_in_payload:
+            payload_name = prop.payload_name
+            optional = prop.optional
+            not_in_payload = prop.not_in_payload
+            if payload_name or optional or not_in_payload:
                 wrapper = BNode()
-                self.graph.add((wrapper, SAMM.property, URIRef(prop.urn)))
-                if prop.payload_name:
-                    self.graph.add((wrapper, SAMM.payloadName, Literal(prop.payload_name)))
-                if prop.optional:
-                    self.graph.add((wrapper, SAMM.optional, Literal(True)))
-                if prop.not_in_payload:
-                    self.graph.add((wrapper, SAMM.notInPayload, Literal(True)))
-                prop_nodes.append(wrapper)
+                add((wrapper, _S.property, uri(prop.urn)))
+                if payload_name:
+                    add((wrapper, _S.payloadName, Literal(payload_name)))
+                if optional:
+                    add((wrapper, _S.optional, _TRUE))
+                if not_in_payload:
+                    add((wrapper, _S.notInPayload, _TRUE))
+                append(wrapper)
             else:
-                prop_nodes.append(URIRef(prop.urn))
-
-        props_list = BNode()
-        Collection(self.graph, props_list, prop_nodes)
-        return props_list
+                append(uri(prop.urn))
+
+        return self._create_list(prop_nodes)
+
+    def _create_list(self, items: List[Node]) -> Node:
+        """Create an RDF list of the items and return its head node."""
+        if not items:
+            return _NIL
+        add = self._add
+        head = node = BNode()
+        last = len(items) - 1
+        for i, item in enumerate(items):
+            add((node, _FIRST, item))
+            rest = BNode() if i < last else _NIL
+            add((node, _REST, rest))
+            node = rest
+        return head
 
     def _write_property(self, prop: Property):
         """Write a Property to the graph."""
-        prop_uri = URIRef(prop.urn)
-        self.graph.add((prop_uri, RDF.type, SAMM.Property))
+        urn = prop.urn
+        written = self._written_props
+        if urn in written:
+            return
+        written.add(urn)
+        add = self._add
+        prop_uri = self._uri(urn)
+        add((prop_uri, _TYPE, _S.Property))
         self._write_common_attributes(prop_uri, prop)
 
         # Write characteristic
-        if prop.characteristic:
-            self._write_characteristic(prop.characteristic)
-            self.graph.add((prop_uri, SAMM.characteristic, URIRef(prop.characteristic.urn)))
+        characteristic = prop.characteristic
+        if characteristic:
+            self._write_characteristic(characteristic)
+            add((prop_uri, _S.characteristic, self._uri(characteristic.urn)))
 
         # Write example value
-        if prop.example_value is not None:
-            example_literal = self._python_to_literal(prop.example_value)
-            self.graph.add((prop_uri, SAMM.exampleValue, example_literal))
+        example_value = prop.example_value
+        if example_value is not None:
+            add((prop_uri, _S.exampleValue, self._python_to_literal(example_value)))
 
         # Note: optional, payloadName, notInPayload are written in wrapper nodes
 
     def _write_characteristic(self, characteristic: Characteristic):
         """Write a Characteristic to the graph."""
-        char_uri = URIRef(characteristic.urn)
+        urn = characteristic.urn
+        written = self._written_chars
+        if urn in written:
+            return
+        written.add(urn)
+        add = self._add
+        char_uri = self._uri(urn)
 
         # Determine RDF type based on characteristic_type
-        char_type_map = {
-            "Measurement": SAMM_C.Measurement,
-            "Quantifiable": SAMM_C.Quantifiable,
-            "Enumeration": SAMM_C.Enumeration,
-            "State": SAMM_C.State,
-            "Collection": SAMM_C.Collection,
-            "List": SAMM_C.List,
-            "Set": SAMM_C.Set,
-            "SortedSet": SAMM_C.SortedSet,
-            "TimeSeries": SAMM_C.TimeSeries,
-            "Either": SAMM_C.Either,
-            "StructuredValue": SAMM_C.StructuredValue,
-            "SingleEntity": SAMM_C.SingleEntity,
-            "Trait": SAMM_C.Trait,
-            "Code": SAMM_C.Code,
-            "Duration": SAMM_C.Duration,
-            "Boolean": SAMM_C.Boolean,
-            "Text": SAMM_C.Text,
-            "MultiLanguageText": SAMM_C.MultiLanguageText,
-            "Timestamp": SAMM_C.Timestamp,
-            "UnitReference": SAMM_C.UnitReference,
-        }
-
-        char_type = char_type_map.get(characteristic.characteristic_type, SAMM.Characteristic)
-        self.graph.add((char_uri, RDF.type, char_type))
+        char_type = characteristic.characteristic_type
+        add((char_uri, _TYPE, _CHAR_TYPE_MAP.get(char_type, _S.Characteristic)))
         self._write_common_attributes(char_uri, characteristic)
 
         # Write dataType
-        if characteristic.data_type:
-            self.graph.add((char_uri, SAMM.dataType, URIRef(characteristic.data_type)))
-
-        # Write unit
-        if characteristic.unit:
-            self.graph.add((char_uri, SAMM_C.unit, URIRef(characteristic.unit)))
-
-        # Write values (for Enumeration/State)
-        if characteristic.values:
-            values_list = BNode()
-            value_literals = [self._python_to_literal(v) for v in characteristic.values]
-            Collection(self.graph, values_list, value_literals)
-            self.graph.add((char_uri, SAMM_C.values, values_list))
-
-        # Write default value (for State)
-        if characteristic.default_value is not None:
-            default_literal = self._python_to_literal(characteristic.default_value)
-            self.graph.add((char_uri, SAMM_C.defaultValue, default_literal))
-
-        # Write elementCharacteristic (for Collection types)
-        if characteristic.element_characteristic:
-            self._write_characteristic(characteristic.element_characteristic)
-            self.graph.add((char_uri, SAMM_C.elementCharacteristic,
-                          URIRef(characteristic.element_characteristic.urn)))
-
-        # Write left and right (for Either)
-        if characteristic.left:
-            self._write_characteristic(characteristic.left)
-            self.graph.add((char_uri, SAMM_C.left, URIRef(characteristic.left.urn)))
-
-        if characteristic.right:
-            self._write_characteristic(characteristic.right)
-            self.graph.add((char_uri, SAMM_C.right, URIRef(characteristic.right.urn)))
-
-        # Write deconstructionRule (for StructuredValue)
-        if characteristic.deconstruction_rule:
-            self.graph.add((char_uri, SAMM_C.deconstructionRule,
-                          Literal(characteristic.deconstruction_rule)))
-
-        # Write elements (for StructuredValue)
-        if characteristic.elements:
-            elements_list = self._create_property_list(characteristic.elements)
-            self.graph.add((char_uri, SAMM_C.elements, elements_list))
+        data_type = characteristic.data_type
+        if data_type:
+            add((char_uri, _S.dataType, self._uri(data_type)))
+
+        # Write the attributes of the characteristic's type; samm:Characteristic
+        # and unknown types may carry any of them
+        emit = self._CHAR_EMITTERS.get(char_type, SAMMWriter._write_characteristic_attributes)
+        if emit is not None:
+            emit(self, char_uri, characteristic)
+
+    def _write_characteristic_attributes(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write every type-specific attribute that is set."""
+        self._write_unit(char_uri, characteristic)
+        self._write_values(char_uri, characteristic)
+        self._write_element_characteristic(char_uri, characteristic)
+        self._write_either(char_uri, characteristic)
+        self._write_structured_value(char_uri, characteristic)
+
+    def _write_unit(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write unit (for Measurement/Quantifiable/Duration)."""
+        unit = characteristic.unit
+        if unit:
+            self._add((char_uri, _SC.unit, self._uri(unit)))
+
+    def _write_values(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write values and default value (for Enumeration/State)."""
+        to_literal = self._python_to_literal
+        values = characteristic.values
+        if values:
+            values_list = self._create_list([to_literal(v) for v in values])
+            self._add((char_uri, _SC.values, values_list))
+
+        default_value = characteristic.default_value
+        if default_value is not None:
+            self._add((char_uri, _SC.defaultValue, to_literal(default_value)))
+
+    def _write_element_characteristic(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write elementCharacteristic (for Collection types)."""
+        element_characteristic = characteristic.element_characteristic
+        if element_characteristic:
+            self._write_characteristic(element_characteristic)
+            self._add((char_uri, _SC.elementCharacteristic, self._uri(element_characteristic.urn)))
+
+    def _write_either(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write left and right (for Either)."""
+        add = self._add
+        left = characteristic.left
+        if left:
+            self._write_characteristic(left)
+            add((char_uri, _SC.left, self._uri(left.urn)))
+
+        right = characteristic.right
+        if right:
+            self._write_characteristic(right)
+            add((char_uri, _SC.right, self._uri(right.urn)))
+
+    def _write_structured_value(self, char_uri: URIRef, characteristic: Characteristic):
+        """Write deconstructionRule and elements (for StructuredValue)."""
+        deconstruction_rule = characteristic.deconstruction_rule
+        if deconstruction_rule:
+            self._add((char_uri, _SC.deconstructionRule, Literal(deconstruction_rule)))
+
+        elements = characteristic.elements
+        if elements:
+            self._add((char_uri, _SC.elements, self._create_property_list(elements)))
+
+    # Type-specific attribute writer per characteristic_type; None for the
+    # samm-c types that only carry a dataType
+    _CHAR_EMITTERS = {
+        "Measurement": _write_unit,
+        "Quantifiable": _write_unit,
+        "Duration": _write_unit,
+        "Enumeration": _write_values,
+        "State": _write_values,
+        "Collection": _write_element_characteristic,
+        "List": _write_element_characteristic,
+        "Set": _write_element_characteristic,
+        "SortedSet": _write_element_characteristic,
+        "TimeSeries": _write_element_characteristic,
+        "Either": _write_either,
+        "StructuredValue": _write_structured_value,
+        "SingleEntity": None,
+        "Trait": None,
+        "Code": None,
+        "Boolean": None,
+        "Text": None,
+        "MultiLanguageText": None,
+        "Timestamp": None,
+        "UnitReference": None,
+    }
 
     def _write_entity(self, entity: Entity):
         """Write an Entity to the graph."""
-        entity_uri = URIRef(entity.urn)
-        entity_type = SAMM.AbstractEntity if entity.is_abstract else SAMM.Entity
-        self.graph.add((entity_uri, RDF.type, entity_type))
+        add = self._add
+        entity_uri = self._uri(entity.urn)
+        entity_type = _S.AbstractEntity if entity.is_abstract else _S.Entity
+        add((entity_uri, _TYPE, entity_type))
         self._write_common_attributes(entity_uri, entity)
 
         # Write properties
         if entity.properties:
             props_list = self._create_property_list(entity.properties)
-            self.graph.add((entity_uri, SAMM.properties, props_list))
+            add((entity_uri, _S.properties, props_list))
 
         # Write extends
         if entity.extends:
-            self.graph.add((entity_uri, SAMM.extends, URIRef(entity.extends)))
+            add((entity_uri, _S.extends, self._uri(entity.extends)))
 
     def _write_operation(self, operation: Operation):
         """Write an Operation to the graph."""
-        op_uri = URIRef(operation.urn)
-        self.graph.add((op_uri, RDF.type, SAMM.Operation))
+        urn = operation.urn
+        written = self._written_ops
+        if urn in written:
+            return
+        written.add(urn)
+        add = self._add
+        op_uri = self._uri(urn)
+        add((op_uri, _TYPE, _S.Operation))
         self._write_common_attributes(op_uri, operation)
 
         # Write input
         if operation.input_properties:
             input_list = self._create_property_list(operation.input_properties)
-            self.graph.add((op_uri, SAMM.input, input_list))
+            add((op_uri, _S.input, input_list))
 
         # Write output
-        if operation.output_property:
-            self._write_property(operation.output_property)
-            self.graph.add((op_uri, SAMM.output, URIRef(operation.output_property.urn)))
+        output_property = operation.output_property
+        if output_property:
+            self._write_property(output_property)
+            add((op_uri, _S.output, self._uri(output_property.urn)))
 
     def _write_event(self, event: Event):
         """Write an Event to the graph."""
-        event_uri = URIRef(event.urn)
-        self.graph.add((event_uri, RDF.type, SAMM.Event))
+        urn = event.urn
+        written = self._written_events
+        if urn in written:
+            return
+        written.add(urn)
+        add = self._add
+        event_uri = self._uri(urn)
+        add((event_uri, _TYPE, _S.Event))
         self._write_common_attributes(event_uri, event)
 
         # Write parameters
         if event.parameters:
             params_list = self._create_property_list(event.parameters)
-            self.graph.add((event_uri, SAMM.parameters, params_list))
+            add((event_uri, _S.parameters, params_list))
 
     def _write_common_attributes(self, uri: URIRef, element: ModelElement):
         """Write common attributes (preferredName, description, see)."""
+        add = self._add
+
         # Write preferredName
-        if element.preferred_name:
-            for lang, text in element.preferred_name.values.items():
-                self.graph.add((uri, SAMM.preferredName, Literal(text, lang=lang)))
+        preferred_name = element.preferred_name
+        if preferred_name is not None and preferred_name.values:
+            term = _S.preferredName
+            for lang, text in preferred_name.values.items():
+                add((uri, term, Literal(text, lang=lang)))
 
         # Write description
-        if element.description:
-            for lang, text in element.description.values.items():
-                self.graph.add((uri, SAMM.description, Literal(text, lang=lang)))
+        description = element.description
+        if description is not None and description.values:
+            term = _S.description
+            for lang, text in description.values.items():
+                add((uri, term, Literal(text, lang=lang)))
 
         # Write see
-        for see_uri in element.see:
-            self.graph.add((uri, SAMM.see, URIRef(see_uri)))
+        see = element.see
+        if see:
+            make_uri = self._uri
+            for see_uri in see:
+                add((uri, _S.see, make_uri(see_uri)))
 
     def _python_to_literal(self, value) -> Literal:
         """Convert a Python value to an RDF Literal."""
+        converter = _LITERAL_CONVERTERS.get(type(value))
+        if converter is not None:
+            return converter(value)
+        # Subclasses of bool/int/float (e.g. IntEnum) keep their base datatype
         if isinstance(value, bool):
-            return Literal(value, datatype=XSD.boolean)
+            return _bool_literal(value)
         elif isinstance(value, int):
-            return Literal(value, datatype=XSD.integer)
+            return _integer_literal(value)
         elif isinstance(value, float):
-            return Literal(value, datatype=XSD.float)
+            return _float_literal(value)
         else:
             return Literal(str(value))
@@ -2,11 +2,20 @@
 Setup script for SAMM Model Editor
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# SAMM_EDITOR_MYPYC=1 compiles the parser with mypyc (needs mypy installed);
+# the pure-Python module is used otherwise
+ext_modules = []
+if os.environ.get("SAMM_EDITOR_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["samm_editor/parser.py"])
+
 setup(
     name="samm-editor",
     version="0.1.0",
@@ -15,6 +24,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -30,6 +40,9 @@ setup(
         "rdflib>=7.0.0",
         "click>=8.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0", "oxrdflib>=0.3.0"],
+    },
     entry_points={
         "console_scripts": [
             "samm-editor=samm_editor.cli:main",
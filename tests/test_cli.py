@@ -0,0 +1,45 @@
+"""Tests for the command-line interface."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from samm_editor.cli import cli
+
+MOVEMENT = Path(__file__).resolve().parent.parent / "examples" / "Movement.ttl"
+
+
+@pytest.mark.parametrize("command, output_option", [
+    (["generate-schema", "--no-cache"], "-o"),
+    (["generate-instance", "--no-cache"], "-o"),
+    (["generate-all", "--no-cache"], "--schema"),
+    (["convert"], "-o"),
+])
+def test_inputs_with_the_same_name_are_rejected(command, output_option, tmp_path):
+    inputs = []
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        inputs.append(str(shutil.copy(MOVEMENT, tmp_path / directory / "Movement.ttl")))
+    out = tmp_path / "out"
+
+    result = CliRunner().invoke(cli, [*command, *inputs, output_option, str(out)])
+    assert result.exit_code == 2
+    assert "would both be written to" in result.output
+    assert not out.exists() or not any(out.iterdir())
+
+
+@pytest.mark.parametrize("command", ["generate-schema", "generate-instance"])
+def test_cache_is_opt_in(command, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    runner = CliRunner()
+
+    result = runner.invoke(cli, [command, str(MOVEMENT), "-o", str(tmp_path / "plain.json")])
+    assert result.exit_code == 0
+    assert not (tmp_path / "cache").exists()
+
+    result = runner.invoke(cli, [command, str(MOVEMENT), "-o", str(tmp_path / "cached.json"), "--cache"])
+    assert result.exit_code == 0
+    assert any((tmp_path / "cache" / "samm-editor").iterdir())
+    assert (tmp_path / "cached.json").read_bytes() == (tmp_path / "plain.json").read_bytes()
@@ -0,0 +1,54 @@
+"""Tests for the JSON instance generator."""
+
+from decimal import Decimal
+
+from samm_editor.json_instance_generator import JSONInstanceGenerator
+from samm_editor.model import Aspect, Characteristic, Entity, Property, SAMMModel
+
+NS = "urn:samm:com.example.test:1.0.0#"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _model() -> SAMMModel:
+    text = Characteristic(NS + "Text", characteristic_type="Text", data_type=XSD_STRING)
+    first = Property(NS + "first", characteristic=text, example_value="one")
+    second = Property(NS + "second", characteristic=text, example_value="two")
+    aspect = Aspect(NS + "Test", properties=[first, second])
+    return SAMMModel(aspect=aspect, namespace=NS)
+
+
+def test_reused_generator_follows_payload_changes():
+    model = _model()
+    generator = JSONInstanceGenerator(model)
+    assert list(generator.generate()) == ["first", "second"]
+
+    model.aspect.properties[0].payload_name = "renamed"
+    model.aspect.properties.append(Property(NS + "extra", example_value="three"))
+    instance = generator.generate()
+    assert list(instance) == ["renamed", "second", "extra"]
+    assert instance == JSONInstanceGenerator(model).generate()
+
+
+def test_reused_generator_follows_characteristic_and_entity_changes():
+    model = _model()
+    prop = Property(NS + "thing", characteristic=Characteristic(NS + "ThingChar", data_type=NS + "Thing"))
+    model.aspect.properties.append(prop)
+    generator = JSONInstanceGenerator(model)
+    assert not isinstance(generator.generate()["thing"], dict)
+
+    model.entities[NS + "Thing"] = Entity(NS + "Thing", properties=[model.aspect.properties[0]])
+    prop.characteristic.characteristic_type = "SingleEntity"
+    instance = generator.generate()
+    assert instance["thing"] == {"first": "one"}
+    assert instance == JSONInstanceGenerator(model).generate()
+
+
+def test_reused_generator_converts_decimals_added_later():
+    model = _model()
+    generator = JSONInstanceGenerator(model)
+    generator.generate()
+
+    model.aspect.properties[0].example_value = Decimal("1.25")
+    instance = generator.generate()
+    assert instance["first"] == 1.25 and type(instance["first"]) is not Decimal
+    assert instance == JSONInstanceGenerator(model).generate()
@@ -0,0 +1,48 @@
+"""Tests for the JSON Schema generator."""
+
+from samm_editor.json_schema_generator import JSONSchemaGenerator
+from samm_editor.model import Aspect, Characteristic, Property, SAMMModel
+
+NS = "urn:samm:com.example.test:1.0.0#"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _model_with_shared_characteristic() -> SAMMModel:
+    status = Characteristic(NS + "Status", characteristic_type="Enumeration",
+                            data_type=XSD_STRING, values=["a", "b"])
+    statuses = Characteristic(NS + "Statuses", characteristic_type="List",
+                              element_characteristic=status)
+    first = Property(NS + "first", characteristic=statuses)
+    second = Property(NS + "second", characteristic=statuses)
+    aspect = Aspect(NS + "Test", properties=[first, second])
+    return SAMMModel(aspect=aspect, namespace=NS)
+
+
+def test_properties_sharing_a_characteristic_get_independent_schemas():
+    schema = JSONSchemaGenerator(_model_with_shared_characteristic()).generate()
+    first = schema["properties"]["first"]
+    second = schema["properties"]["second"]
+    assert first == second
+
+    first["items"]["enum"].append("c")
+    first["items"]["type"] = "integer"
+    assert second["items"] == {"type": "string", "enum": ["a", "b"]}
+
+
+def test_enum_values_are_not_shared_with_the_model():
+    model = _model_with_shared_characteristic()
+    schema = JSONSchemaGenerator(model).generate()
+    schema["properties"]["first"]["items"]["enum"].append("c")
+    assert model.aspect.properties[0].characteristic.element_characteristic.values == ["a", "b"]
+
+
+def test_reused_generator_follows_model_changes():
+    model = _model_with_shared_characteristic()
+    generator = JSONSchemaGenerator(model)
+    generator.generate()
+
+    status = model.aspect.properties[0].characteristic.element_characteristic
+    status.values = ["x"]
+    schema = generator.generate()
+    assert schema["properties"]["first"]["items"]["enum"] == ["x"]
+    assert schema == JSONSchemaGenerator(model).generate()
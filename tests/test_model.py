@@ -0,0 +1,24 @@
+"""Tests for the model data structures."""
+
+import copy
+import dataclasses
+
+from samm_editor.model import Entity, Property
+
+NS = "urn:samm:com.example.test:1.0.0#"
+
+
+def test_local_name_follows_urn_changes():
+    prop = Property(NS + "speed")
+    assert prop.local_name == "speed"
+    prop.urn = NS + "velocity"
+    assert prop.local_name == "velocity"
+
+
+def test_local_name_of_copies():
+    entity = Entity(NS + "Machine")
+    assert dataclasses.replace(entity, urn=NS + "Robot").local_name == "Robot"
+    clone = copy.copy(entity)
+    clone.urn = NS + "Robot"
+    assert clone.local_name == "Robot"
+    assert entity.local_name == "Machine"
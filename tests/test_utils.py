@@ -0,0 +1,34 @@
+"""Tests for the shared helpers."""
+
+import pytest
+
+from samm_editor import _utils
+
+orjson = pytest.importorskip("orjson")
+
+NON_ASCII = {
+    "title": "Geschwindigkeit – km/h",
+    "description": "速度 «vitesse» ☃",
+    "enum": ["Ä", "ö", "𝄞"],
+    "nested": {"ключ": "значение", "empty": {}, "list": []},
+}
+
+
+def _fallback(monkeypatch):
+    monkeypatch.setattr(_utils, "orjson", None)
+
+
+def test_dumps_json_matches_orjson_on_non_ascii(monkeypatch):
+    fast = _utils.dumps_json(NON_ASCII)
+    _fallback(monkeypatch)
+    assert _utils.dumps_json(NON_ASCII) == fast
+
+
+def test_dump_json_file_matches_orjson_on_non_ascii(monkeypatch, tmp_path):
+    fast_file = tmp_path / "fast.json"
+    stdlib_file = tmp_path / "stdlib.json"
+    _utils.dump_json_file(NON_ASCII, str(fast_file))
+    _fallback(monkeypatch)
+    _utils.dump_json_file(NON_ASCII, str(stdlib_file))
+    assert stdlib_file.read_bytes() == fast_file.read_bytes()
+    assert "速度".encode("utf-8") in stdlib_file.read_bytes()
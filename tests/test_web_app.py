@@ -0,0 +1,38 @@
+"""Tests for the web app's HTTP behaviour."""
+
+import gzip
+
+import pytest
+
+pytest.importorskip("flask")
+
+from samm_editor.web.app import COMPRESS_MIN_SIZE, app  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def _vary(response):
+    return {value.strip().lower() for value in response.headers.get('Vary', '').split(',')}
+
+
+def test_gzip_response_varies_on_accept_encoding(client):
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'accept-encoding' in _vary(response)
+    assert len(gzip.decompress(response.get_data())) >= COMPRESS_MIN_SIZE
+
+
+def test_uncompressed_response_varies_on_accept_encoding(client):
+    response = client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in response.headers
+    assert 'accept-encoding' in _vary(response)
+
+
+def test_small_response_varies_on_accept_encoding(client):
+    response = client.get('/api/load-example/NoSuchExample', headers={'Accept-Encoding': 'gzip'})
+    assert len(response.get_data()) < COMPRESS_MIN_SIZE
+    assert 'Content-Encoding' not in response.headers
+    assert 'accept-encoding' in _vary(response)
@@ -0,0 +1,133 @@
+"""Tests for the Turtle writer."""
+
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph, Literal, RDF, URIRef
+from rdflib.compare import isomorphic
+
+from samm_editor.model import (
+    Aspect, Characteristic, Entity, LocalizedString, Property, SAMMModel
+)
+from samm_editor.parser import SAMMParser
+from samm_editor.writer import SAMM, SAMMWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA = Path(__file__).resolve().parent / "data"
+NS = "urn:samm:com.example.test:1.0.0#"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _written_graph(writer: SAMMWriter) -> Graph:
+    """The graph the writer serializes: its triple buffer."""
+    writer._build_triples()
+    graph = Graph()
+    for triple in writer._triples:
+        graph.add(triple)
+    return graph
+
+
+def _assert_same_graph(actual: Graph, expected: Graph):
+    """Compare graphs whose IRIs rdflib may refuse to serialize (and so to canonicalize)."""
+    def split(graph):
+        ground, with_bnodes = set(), Graph()
+        for triple in graph:
+            if any(isinstance(term, BNode) for term in triple):
+                with_bnodes.add(triple)
+            else:
+                ground.add(triple)
+        return ground, with_bnodes
+
+    actual_ground, actual_bnodes = split(actual)
+    expected_ground, expected_bnodes = split(expected)
+    assert actual_ground == expected_ground
+    assert isomorphic(actual_bnodes, expected_bnodes)
+
+
+def _round_trip(writer: SAMMWriter, tmp_path: Path, streaming: bool) -> Graph:
+    out = tmp_path / ("out.nt" if streaming else "out.ttl")
+    writer.write_to_file(str(out), streaming=streaming)
+    return Graph().parse(str(out), format="nt" if streaming else "turtle")
+
+
+@pytest.mark.parametrize("name", ["Movement", "Product"])
+def test_example_turtle_matches_golden_file(name):
+    model = SAMMParser().parse_file(str(ROOT / "examples" / f"{name}.ttl"))
+    golden = (DATA / f"{name}_written.ttl").read_text(encoding="utf-8")
+    assert SAMMWriter(model).write_to_string() == golden
+
+
+@pytest.mark.parametrize("name", ["Movement", "Product"])
+@pytest.mark.parametrize("streaming", [False, True])
+def test_example_output_parses_back_to_golden_graph(name, streaming, tmp_path):
+    model = SAMMParser().parse_file(str(ROOT / "examples" / f"{name}.ttl"))
+    golden = Graph().parse(str(DATA / f"{name}_written.ttl"), format="turtle")
+    assert isomorphic(_round_trip(SAMMWriter(model), tmp_path, streaming), golden)
+
+
+def _model_with_awkward_terms() -> SAMMModel:
+    text = Characteristic(NS + "Text", characteristic_type="Text", data_type=XSD_STRING)
+    status = Characteristic(NS + "Status", characteristic_type="State", data_type=XSD_STRING,
+                            values=["a", 'quote " and \\ backslash', "line\nbreak", 3, 1.5, True],
+                            default_value="a")
+    odd = Property(NS + "odd", characteristic=text,
+                   see=['http://example.com/a b', 'http://example.com/<x>{y}|^`"\\'])
+    wrapped = Property(NS + "wrapped", characteristic=status, optional=True, payload_name="w",
+                       preferred_name=LocalizedString({"en": "Wrapped", "de": "Verpackt ä"}))
+    entity = Entity(NS + "Thing", properties=[wrapped, odd])
+    aspect = Aspect(NS + "Test", properties=[odd, wrapped])
+    return SAMMModel(aspect=aspect, entities={entity.urn: entity},
+                     characteristics={status.urn: status}, namespace=NS)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_iris_and_literals_that_need_escaping_round_trip(streaming, tmp_path):
+    model = _model_with_awkward_terms()
+    expected = _written_graph(SAMMWriter(model))
+    assert (URIRef(NS + "odd"), SAMM.see, URIRef('http://example.com/a b')) in expected
+    _assert_same_graph(_round_trip(SAMMWriter(model), tmp_path, streaming), expected)
+
+
+def test_iri_characters_are_escaped_in_turtle():
+    turtle = SAMMWriter(_model_with_awkward_terms()).write_to_string()
+    assert "<http://example.com/a\\u0020b>" in turtle
+    assert "<http://example.com/\\u003Cx\\u003E\\u007By\\u007D\\u007C\\u005E\\u0060\\u0022\\u005C>" in turtle
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_blank_nodes_of_any_shape_round_trip(streaming, tmp_path):
+    writer = SAMMWriter(SAMMModel(namespace=NS))
+    writer._build_triples()
+    subject, other = URIRef(NS + "s"), URIRef(NS + "o")
+    shared, empty, loop_a, loop_b = BNode(), BNode(), BNode(), BNode()
+    odd_list, odd_rest = BNode(), BNode()
+    writer._triples.extend([
+        # Referenced twice: needs a label
+        (subject, SAMM.properties, shared),
+        (other, SAMM.properties, shared),
+        (shared, SAMM.property, other),
+        # Referenced once, no properties
+        (subject, SAMM.events, empty),
+        # Blank nodes referencing each other only
+        (loop_a, SAMM.see, loop_b),
+        (loop_b, SAMM.see, loop_a),
+        # A list node with an extra predicate is not a plain list
+        (subject, SAMM.operations, odd_list),
+        (odd_list, RDF.first, Literal(1)),
+        (odd_list, RDF.rest, odd_rest),
+        (odd_rest, RDF.first, Literal(2)),
+        (odd_rest, RDF.rest, RDF.nil),
+        (odd_rest, SAMM.description, Literal("extra")),
+    ])
+    expected = Graph()
+    for triple in writer._triples:
+        expected.add(triple)
+
+    out = tmp_path / ("out.nt" if streaming else "out.ttl")
+    with open(out, "w", encoding="utf-8") as f:
+        if streaming:
+            writer._write_ntriples(f)
+        else:
+            writer._write_turtle(f)
+    actual = Graph().parse(str(out), format="nt" if streaming else "turtle")
+    assert isomorphic(actual, expected)